@@ -0,0 +1,6 @@
+"""
+Benchmarks for proplot run with airspeed velocity. See CONTRIBUTING.rst for details.
+"""
+import matplotlib
+
+matplotlib.use('agg')  # run without a display
@@ -0,0 +1,71 @@
+"""
+Benchmarks for colormap construction.
+"""
+import numpy as np
+
+import proplot as pplt
+
+# Built-in colormaps whose lookup tables are built in a perceptual colorspace
+PERCEPTUAL_CMAPS = sorted(
+    name for name, cmap in pplt.colors._cmap_database.items()
+    if isinstance(cmap, pplt.PerceptualColormap)
+)
+
+
+class PerceptualColormapInit:
+    """
+    Build the lookup tables of the built-in perceptual colormaps.
+    """
+    params = (PERCEPTUAL_CMAPS, [256, 1024, 4096])
+    param_names = ['name', 'N']
+
+    def setup(self, name, N):
+        self.cmap = pplt.colors._cmap_database[name].copy(N=N)
+
+    def time_init(self, name, N):
+        self.cmap._init()
+
+
+class PerceptualColormapCreate:
+    """
+    Create perceptual colormaps from lists of colors and build the lookup tables.
+    """
+    params = [256, 1024, 4096]
+    param_names = ['N']
+
+    def time_from_list(self, N):
+        cmap = pplt.PerceptualColormap.from_list(['blue', 'white', 'red'], N=N)
+        cmap._init()
+
+    def time_from_color(self, N):
+        cmap = pplt.PerceptualColormap.from_color('red', N=N)
+        cmap._init()
+
+
+class DiscreteNormCall:
+    """
+    Normalize and color a 4096 x 4096 array with discrete levels.
+    """
+    params = ['linear', 'diverging', 'log']
+    param_names = ['norm']
+
+    def setup(self, norm):
+        state = np.random.RandomState(51423)
+        data = state.rand(4096, 4096)
+        if norm == 'log':
+            levels = np.logspace(-3, 0, 21)
+            self.data = 10 ** (3 * (data - 1))
+        else:
+            levels = np.linspace(-1, 1, 21)
+            self.data = 2 * data - 1
+        self.norm = pplt.DiscreteNorm(levels, norm=pplt.Norm(norm))
+        self.cmap = pplt.Colormap('viridis')
+
+    def time_call(self, norm):
+        self.norm(self.data)
+
+    def time_to_rgba(self, norm):
+        self.norm._to_rgba(self.data, self.cmap, bytes=True)
+
+    def peakmem_call(self, norm):
+        self.norm(self.data)
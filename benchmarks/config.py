@@ -0,0 +1,62 @@
+"""
+Benchmarks for looking up settings.
+"""
+import proplot as pplt
+
+# Settings looked up by the benchmarks
+FILL_PROPS = {
+    'color': 'axes.edgecolor',
+    'linewidth': 'axes.linewidth',
+    'size': 'tick.labelsize',
+    'weight': 'tick.labelweight',
+    'family': 'font.family',
+}
+
+
+class ConfiguratorFind:
+    """
+    Look up settings inside nested context blocks.
+    """
+    params = ([0, 1, 3], [False, True])
+    param_names = ['depth', 'context']
+
+    def setup(self, depth, context):
+        for i in range(depth):
+            pplt.rc.context({'axes.linewidth': i + 1, 'tick.labelsize': 8}, mode=2)
+            pplt.rc.__enter__()
+
+    def teardown(self, depth, context):
+        for _ in range(depth):
+            pplt.rc.__exit__()
+
+    def time_find(self, depth, context):
+        for _ in range(100):
+            pplt.rc.find('axes.linewidth', context=context)
+
+    def time_fill(self, depth, context):
+        for _ in range(100):
+            pplt.rc.fill(FILL_PROPS, context=context)
+
+
+class ConfiguratorCategory:
+    """
+    Look up every setting in a category.
+    """
+    params = ['land', 'axes', 'tick']
+    param_names = ['category']
+
+    def time_category(self, category):
+        pplt.rc.category(category)
+
+
+class ConfiguratorContext:
+    """
+    Enter and exit context blocks that change settings.
+    """
+    params = [0, 1, 2]
+    param_names = ['mode']
+
+    def time_context(self, mode):
+        for _ in range(100):
+            with pplt.rc.context({'axes.linewidth': 2, 'font.size': 12}, mode=mode):
+                pass
@@ -0,0 +1,129 @@
+"""
+Benchmarks for drawing figures.
+"""
+import io
+
+import numpy as np
+
+import proplot as pplt
+
+
+class FigureSubplots:
+    """
+    Create figures with grids of subplots.
+    """
+    params = [1, 4, 8]
+    param_names = ['n']
+
+    def teardown(self, n):
+        pplt.close('all')
+
+    def time_subplots(self, n):
+        pplt.subplots(ncols=n, nrows=n)
+
+
+class FigureAutoLayout:
+    """
+    Compute the automatic layout for grids of labeled subplots.
+    """
+    params = [1, 4, 8]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.fig, axs = pplt.subplots(ncols=n, nrows=n)
+        axs.format(title='title', xlabel='xlabel', ylabel='ylabel')
+
+    def teardown(self, n):
+        pplt.close(self.fig)
+
+    def time_auto_layout(self, n):
+        self.fig.auto_layout(force=True)
+
+
+class FigureSave:
+    """
+    Save a figure with several subplots, colorbars, and legends.
+    """
+    params = ['png', 'pdf']
+    param_names = ['format']
+    number = 1
+
+    def setup(self, format):
+        state = np.random.RandomState(51423)
+        self.fig, axs = pplt.subplots(ncols=3, nrows=2, share=False)
+        for ax in axs:
+            ax.pcolormesh(state.rand(20, 20), colorbar='r')
+            ax.plot(state.rand(20) * 20, label='line', legend='b')
+            ax.format(title='title', xlabel='xlabel', ylabel='ylabel')
+        self.buffer = io.BytesIO()
+
+    def teardown(self, format):
+        pplt.close(self.fig)
+
+    def time_save(self, format):
+        self.buffer.seek(0)
+        self.fig.save(self.buffer, format=format)
+
+
+class FigureDraw:
+    """
+    Redraw a figure with several subplots, colorbars, and legends.
+    """
+    params = [False, True]
+    param_names = ['force']
+
+    def setup(self, force):
+        state = np.random.RandomState(51423)
+        self.fig, axs = pplt.subplots(ncols=3, nrows=2, share=False)
+        for ax in axs:
+            ax.pcolormesh(state.rand(20, 20), colorbar='r')
+            ax.plot(state.rand(20) * 20, label='line', legend='b')
+            ax.format(title='title', xlabel='xlabel', ylabel='ylabel')
+        self.fig.format(suptitle='Super title')
+        self.fig.canvas.draw()
+
+    def teardown(self, force):
+        pplt.close(self.fig)
+
+    def time_draw(self, force):
+        if force:
+            self.fig.auto_layout(force=True)
+        self.fig.canvas.draw()
+
+    def time_draw_data(self, force):
+        line = self.fig.axes[0].lines[0]
+        line.set_ydata(line.get_ydata()[::-1])
+        if force:
+            self.fig.auto_layout(force=True)
+        self.fig.canvas.draw()
+
+    def time_draw_format(self, force):
+        ax = self.fig.axes[0]
+        title = 'title' if ax.get_title() == 'new title' else 'new title'
+        ax.format(title=title)  # alternate so repeats measure the same layout
+        if force:
+            self.fig.auto_layout(force=True)
+        self.fig.canvas.draw()
+
+
+class GridSpecTightSpace:
+    """
+    Compute the tight space between subplots in large grids.
+    """
+    params = [10, 30, 50]
+    param_names = ['n']
+    number = 1
+    repeat = 1
+    timeout = 600
+
+    def setup(self, n):
+        self.fig, axs = pplt.subplots(ncols=n, nrows=n)
+        for ax in axs:
+            ax._tight_bbox = ax.get_position().transformed(self.fig.transFigure)
+
+    def teardown(self, n):
+        pplt.close(self.fig)
+
+    def time_tight_space(self, n):
+        self.fig.gridspec._get_tight_space('w')
+        self.fig.gridspec._get_tight_space('h')
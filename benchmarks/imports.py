@@ -0,0 +1,10 @@
+"""
+Benchmarks for importing proplot.
+"""
+
+
+def timeraw_import():
+    """
+    Import proplot in a fresh interpreter.
+    """
+    return 'import proplot'
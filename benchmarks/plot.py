@@ -0,0 +1,176 @@
+"""
+Benchmarks for plotting commands.
+"""
+import io
+
+import numpy as np
+
+import proplot as pplt
+
+
+class PlotAxes2D:
+    """
+    Plot large arrays with automatically selected discrete levels.
+    """
+    params = (['pcolormesh', 'contourf'], [1024, 2048, 4096])
+    param_names = ['command', 'size']
+    number = 1  # plot on fresh axes
+    timeout = 300
+
+    def setup(self, command, size):
+        state = np.random.RandomState(51423)
+        self.data = state.rand(size, size).cumsum(axis=0).cumsum(axis=1)
+        self.fig, self.ax = pplt.subplots()
+
+    def teardown(self, command, size):
+        pplt.close(self.fig)
+
+    def time_plot(self, command, size):
+        getattr(self.ax, command)(self.data, discrete=True)
+
+    def time_plot_draw(self, command, size):
+        getattr(self.ax, command)(self.data, discrete=True)
+        self.fig.canvas.draw()
+
+
+class PlotAxesDownsample:
+    """
+    Plot and save large arrays reduced to the axes resolution.
+    """
+    params = ([False, True], ['mean', 'nearest'])
+    param_names = ['downsample', 'method']
+    number = 1  # plot on fresh axes
+    timeout = 300
+
+    def setup(self, downsample, method):
+        state = np.random.RandomState(51423)
+        self.data = state.rand(2048, 2048)
+        self.fig, self.ax = pplt.subplots()
+
+    def teardown(self, downsample, method):
+        pplt.close(self.fig)
+
+    def time_pcolormesh_save(self, downsample, method):
+        with pplt.rc.context({'savefig.dpi': 100}):
+            self.ax.pcolormesh(
+                self.data, discrete=False,
+                downsample=downsample, downsample_method=method,
+            )
+            self.fig.savefig(io.BytesIO(), format='pdf')
+
+
+class GeoAxesFormat:
+    """
+    Format geographic axes with features and gridline labels.
+    """
+    params = [False, True]
+    param_names = ['labels']
+
+    def setup(self, labels):
+        try:
+            import cartopy  # noqa: F401
+        except ImportError:
+            raise NotImplementedError('cartopy is not installed.')
+        self.fig, self.ax = pplt.subplots(proj='robin')
+
+    def teardown(self, labels):
+        pplt.close(self.fig)
+
+    def time_format(self, labels):
+        self.ax.format(coast=True, land=True, lonlines=30, latlines=30, labels=labels)
+
+
+class PlotAxesRobust:
+    """
+    Select colormap limits for large arrays with missing values.
+    """
+    params = ([False, True], [None, 100000])
+    param_names = ['robust', 'sample']
+
+    def setup(self, robust, sample):
+        state = np.random.RandomState(51423)
+        self.data = state.rand(4096, 4096)
+        self.data[::5] = np.nan
+        self.fig, axs = pplt.subplots()
+        self.ax = axs[0]
+
+    def teardown(self, robust, sample):
+        pplt.close(self.fig)
+
+    def time_limits(self, robust, sample):
+        with pplt.rc.context({'cmap.robust_sample': sample}):
+            self.ax._parse_level_lim(self.data, robust=robust)
+
+
+class PlotAxesLazy:
+    """
+    Plot large dask arrays without loading them into memory.
+    """
+    params = [1024, 4096, 8192]
+    param_names = ['size']
+    number = 1  # plot on fresh axes
+    timeout = 300
+
+    def setup(self, size):
+        try:
+            import dask.array as da
+        except ImportError:
+            raise NotImplementedError('dask is not installed.')
+        state = da.random.RandomState(51423)
+        self.data = state.random_sample((size, size), chunks=1024)
+        self.fig, self.ax = pplt.subplots()
+
+    def teardown(self, size):
+        pplt.close(self.fig)
+
+    def time_pcolormesh(self, size):
+        self.ax.pcolormesh(self.data, discrete=True)
+
+
+class PlotAxesLabels:
+    """
+    Plot and draw value labels for large heatmaps.
+    """
+    params = [10, 30, 100]
+    param_names = ['size']
+    number = 1  # plot on fresh axes
+    timeout = 300
+
+    def setup(self, size):
+        state = np.random.RandomState(51423)
+        self.data = state.rand(size, size)
+        self.fig, self.ax = pplt.subplots()
+
+    def teardown(self, size):
+        pplt.close(self.fig)
+
+    def time_heatmap(self, size):
+        self.ax.heatmap(self.data, labels=True)
+
+    def time_heatmap_draw(self, size):
+        self.ax.heatmap(self.data, labels=True)
+        self.fig.canvas.draw()
+
+
+class PlotAxesContourLabels:
+    """
+    Plot labeled filled contours with many levels.
+    """
+    params = [{}, {'fast': True}, {'maxlabels': 5}]
+    param_names = ['labels_kw']
+    number = 1  # plot on fresh axes
+    timeout = 300
+
+    def setup(self, labels_kw):
+        state = np.random.RandomState(51423)
+        x = np.linspace(0, 6 * np.pi, 300)
+        self.data = np.sin(x)[:, None] * np.cos(x)[None, :]
+        self.data += 0.015 * state.randn(300, 300).cumsum(axis=0)
+        self.fig, self.axs = pplt.subplots(ncols=2, nrows=2)
+
+    def teardown(self, labels_kw):
+        pplt.close(self.fig)
+
+    def time_contourf_labels(self, labels_kw):
+        for ax in self.axs:
+            ax.contourf(self.data, levels=20, labels=True, labels_kw=labels_kw)
@@ -3,16 +3,40 @@
 A succinct matplotlib wrapper for making beautiful, publication-quality graphics.
 """
 # SCM versioning
-import pkg_resources as pkg
+# NOTE: Importing pkg_resources is slow so use importlib.metadata when available.
 name = 'proplot'
 try:
-    version = __version__ = pkg.get_distribution(__name__).version
-except pkg.DistributionNotFound:
+    from importlib.metadata import PackageNotFoundError, version as _get_version
+except ImportError:  # python < 3.8
+    from pkg_resources import DistributionNotFound as PackageNotFoundError
+    from pkg_resources import get_distribution
+    _get_version = lambda name: get_distribution(name).version  # noqa: E731
+try:
+    version = __version__ = _get_version(__name__)
+except PackageNotFoundError:
     version = __version__ = 'unknown'
 
+# Lazy loading mode. Set the environment variable PROPLOT_LAZY to skip importing
+# the demo functions until they are requested. They are listed in __all__ so that
+# 'from proplot import *' is unchanged. Cartopy and basemap are imported by the
+# proj, ticker, and axes modules whenever they are installed, so are not deferred.
+import os as _os
+_lazy = bool(_os.environ.get('PROPLOT_LAZY'))
+_lazy_attrs = {
+    'demos': None,
+    'show_cmaps': 'demos',
+    'show_channels': 'demos',
+    'show_colors': 'demos',
+    'show_colorspaces': 'demos',
+    'show_cycles': 'demos',
+    'show_fonts': 'demos',
+}
+
 # Import dependencies early to isolate import times
 from . import internals, externals, tests  # noqa: F401
 from .internals.benchmarks import _benchmark
+_import_timer = _benchmark('import')  # see proplot.profile
+_import_timer.__enter__()
 with _benchmark('pyplot'):
     from matplotlib import pyplot  # noqa: F401
 with _benchmark('cartopy'):
@@ -49,8 +73,10 @@ with _benchmark('constructor'):
     from .constructor import *  # noqa: F401 F403
 with _benchmark('ui'):
     from .ui import *  # noqa: F401 F403
-with _benchmark('demos'):
-    from .demos import *  # noqa: F401 F403
+if not _lazy:
+    with _benchmark('demos'):
+        from .demos import *  # noqa: F401 F403
+from . import profile  # noqa: F401
 
 # Dynamically add registered classes to top-level namespace
 from . import proj as crs  # backwards compatibility  # noqa: F401
@@ -63,13 +89,13 @@ for _src in (NORMS, LOCATORS, FORMATTERS, SCALES, PROJS):
 
 # Register objects
 from .config import register_cmaps, register_cycles, register_colors, register_fonts
-with _benchmark('cmaps'):
+with _benchmark('register_cmaps'):
     register_cmaps(default=True)
-with _benchmark('cycles'):
+with _benchmark('register_cycles'):
     register_cycles(default=True)
-with _benchmark('colors'):
+with _benchmark('register_colors'):
     register_colors(default=True)
-with _benchmark('fonts'):
+with _benchmark('register_fonts'):
     register_fonts(default=True)
 
 # Validate colormap names and propagate 'cycle' to 'axes.prop_cycle'
@@ -97,3 +123,31 @@ for _src in (rc_proplot, rc_matplotlib):
         except ValueError as err:
             warnings._warn_proplot(f'Invalid user rc file setting: {err}')
             _src[_key] = 'black'  # fill value
+
+
+def __getattr__(attr):
+    """
+    Import lazily loaded modules and functions on first use (see PEP 562).
+    """
+    if attr not in _lazy_attrs:
+        raise AttributeError(f'module {__name__!r} has no attribute {attr!r}')
+    import importlib
+    module = importlib.import_module('.' + (_lazy_attrs[attr] or attr), __name__)
+    obj = getattr(module, attr) if _lazy_attrs[attr] else module
+    globals()[attr] = obj
+    return obj
+
+
+def __dir__():
+    """
+    Include lazily loaded modules and functions in the namespace.
+    """
+    return sorted({*globals(), *_lazy_attrs})
+
+
+# Public namespace used by 'from proplot import *'
+# NOTE: Python >= 3.7 resolves lazily loaded names with __getattr__ on star-import.
+__all__ = sorted({*(_name for _name in globals() if _name[:1] != '_'), *_lazy_attrs})
+
+# Finish timing the import
+_import_timer.__exit__()
@@ -38,6 +38,7 @@ from ..internals import (
     _pop_rc,
     _translate_loc,
     _version_mpl,
+    benchmarks,
     docstring,
     guides,
     labels,
@@ -786,6 +787,7 @@ class Axes(maxes.Axes):
         self._panel_sharey_group = False  # see _apply_auto_share
         self._panel_side = None
         self._tight_bbox = None  # bounding boxes are saved
+        self._tight_bbox_cache = None  # (fingerprint, bounding box, axes origin)
         self.xaxis.isDefault_minloc = True  # ensure enabled at start (needed for dual)
         self.yaxis.isDefault_minloc = True
 
@@ -2106,6 +2108,68 @@ class Axes(maxes.Axes):
         else:
             return (row1, row2)
 
+    def _get_tight_key(self, renderer=None, args=(), kwargs=None, saved=False):
+        """
+        Return a fingerprint of the properties that determine the tight bounding
+        box relative to the axes position. Includes the axes size in pixels, the
+        limits, the tick labels, titles, and axis labels, and the artists that
+        extend outside of the axes (e.g. legends and inset colorbars). If `saved`
+        is ``True`` the fingerprint is stored alongside a new bounding box, so
+        artists modified since the last draw are considered up-to-date.
+        """
+        # NOTE: Title and axis label positions are reset on every draw using the
+        # axes size, tick label extents, and padding, so we only record the padding.
+        # The axes size is rounded to ignore floating point gridspec differences.
+        # NOTE: Tick labels are only updated at draw time, so we also record the
+        # view limits and tickers used to generate them.
+        titles = tuple(self._title_dict.values())
+        artists = self.get_default_bbox_extra_artists()
+        axis_list = [self.xaxis, self.yaxis, getattr(self, 'zaxis', None)]
+        axis_list.extend(obj for obj in artists if isinstance(obj, maxis.Axis))
+        kwargs = kwargs or {}
+        kwargs = {key: value for key, value in kwargs.items() if value is not None}
+        key = [
+            type(renderer), args, kwargs, self.figure.dpi,
+            np.round(self.bbox.size, 6).tolist(),
+            self.get_visible(), self.axison, self.get_aspect(),
+            self.get_xlim(), self.get_ylim(),
+            self._title_pad, self._abc_title_pad, self._abc_loc,
+        ]
+        key.extend(labels._get_label_key(obj, position=False) for obj in titles)
+        for axis in dict.fromkeys(filter(None, axis_list)):
+            tickers = (
+                axis.get_major_locator(), axis.get_major_formatter(),
+                axis.get_minor_locator(), axis.get_minor_formatter(),
+            )
+            key.append((
+                axis.get_visible(), axis.get_scale(), axis.labelpad,
+                tuple(axis.get_view_interval()),
+                *(  # null formatters are replaced by _apply_axis_sharing()
+                    type(ticker) if isinstance(ticker, mticker.NullFormatter)
+                    else ticker for ticker in tickers
+                ),
+                labels._get_label_key(axis.label, position=False),
+                labels._get_label_key(axis.offsetText, position=False),
+            ))
+            key.extend(
+                (
+                    tick.get_pad(), tick.get_tick_padding(),
+                    labels._get_label_key(tick.label1),
+                    labels._get_label_key(tick.label2),
+                )
+                for tick in (*axis.majorTicks, *axis.minorTicks)
+            )
+        for artist in artists:
+            if isinstance(artist, maxis.Axis) or artist in titles:
+                continue
+            if isinstance(artist, Axes):  # e.g. inset axes and inset colorbars
+                locator = artist.get_axes_locator()
+                bounds = locator or artist.get_position(original=True).bounds
+                key.append((bounds, artist._get_tight_key(renderer, saved=saved)))
+            else:
+                key.append(labels._get_artist_key(artist, ignore_stale=saved))
+        return key
+
     def _range_tightbbox(self, s):
         """
         Return the tight bounding box span from the cached bounding box.
@@ -2463,6 +2527,7 @@ class Axes(maxes.Axes):
             fig._update_super_labels(side, labels, **kw)
 
     @docstring._snippet_manager
+    @benchmarks._benchmark_func('Axes.format')
     def format(
         self, *, title=None, title_kw=None, abc_kw=None,
         ltitle=None, lefttitle=None,
@@ -2611,8 +2676,25 @@ class Axes(maxes.Axes):
             self._colorbar_fill.update_ticks(manual_only=True)  # only if needed
         if self._inset_parent is not None and self._inset_zoom:
             self.indicate_inset_zoom()
-        self._tight_bbox = super().get_tightbbox(renderer, *args, **kwargs)
-        return self._tight_bbox
+        # NOTE: Here we skip the expensive renderer passes for axes whose content
+        # is unchanged since the last tight layout and simply translate the cached
+        # bounding box by the change in axes position. Large subplot grids where a
+        # single subplot is modified between draws only need one new bounding box.
+        # NOTE: The fingerprint is recorded after computing the bounding box because
+        # matplotlib updates the tick labels inside get_tightbbox() and draw().
+        cache = self._tight_bbox_cache
+        x0, y0 = self.bbox.x0, self.bbox.y0
+        key = self._get_tight_key(renderer, args, kwargs)
+        if cache is not None and cache[0] == key:
+            bbox = cache[1]
+            if bbox is not None:
+                bbox = bbox.translated(x0 - cache[2], y0 - cache[3])
+        else:
+            bbox = super().get_tightbbox(renderer, *args, **kwargs)
+            key = self._get_tight_key(renderer, args, kwargs, saved=True)
+            self._tight_bbox_cache = (key, bbox, x0, y0)
+        self._tight_bbox = bbox
+        return bbox
 
     def get_default_bbox_extra_artists(self):
         # Further restrict artists to those with disabled clipping
@@ -14,7 +14,15 @@ from .. import scale as pscale
 from .. import ticker as pticker
 from ..config import rc
 from ..internals import ic  # noqa: F401
-from ..internals import _not_none, _pop_rc, _version_mpl, docstring, labels, warnings
+from ..internals import (
+    _not_none,
+    _pop_rc,
+    _version_mpl,
+    benchmarks,
+    docstring,
+    labels,
+    warnings,
+)
 from . import plot, shared
 
 __all__ = ['CartesianAxes']
@@ -378,7 +386,7 @@ class CartesianAxes(shared._SharedAxes, plot.PlotAxes):
             if level > 2:
                 # WARNING: Cannot set NullFormatter because shared axes share the
                 # same Ticker(). Instead use approach copied from mpl subplots().
-                axis.set_tick_params(which='both', labelbottom=False, labeltop=False)
+                self._hide_tick_labels(axis, labelbottom=False, labeltop=False)
         # Y axis
         axis = self.yaxis
         if self._sharey is not None and axis.get_visible():
@@ -387,9 +395,19 @@ class CartesianAxes(shared._SharedAxes, plot.PlotAxes):
                 labels._transfer_label(axis.label, self._sharey.yaxis.label)
                 axis.label.set_visible(False)
             if level > 2:
-                axis.set_tick_params(which='both', labelleft=False, labelright=False)
+                self._hide_tick_labels(axis, labelleft=False, labelright=False)
         axis.set_minor_formatter(mticker.NullFormatter())
 
+    @staticmethod
+    def _hide_tick_labels(axis, **kwargs):
+        """
+        Hide the major and minor tick labels. This is skipped if they are already
+        hidden because `~matplotlib.axis.Axis.set_tick_params` updates every tick.
+        """
+        kws = (axis._major_tick_kw, axis._minor_tick_kw)
+        if any(kw.get(key, True) for kw in kws for key in ('label1On', 'label2On')):
+            axis.set_tick_params(which='both', **kwargs)
+
     def _add_alt(self, sx, **kwargs):
         """
         Add an alternate axes.
@@ -881,6 +899,7 @@ class CartesianAxes(shared._SharedAxes, plot.PlotAxes):
                 axis.offsetText.set_verticalalignment(OPPOSITE_SIDE[offsetloc])
 
     @docstring._snippet_manager
+    @benchmarks._benchmark_func('Axes.format')
     def format(
         self, *,
         aspect=None,
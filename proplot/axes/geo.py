@@ -15,7 +15,14 @@ from .. import constructor
 from .. import proj as pproj
 from ..config import rc
 from ..internals import ic  # noqa: F401
-from ..internals import _not_none, _pop_rc, _version_cartopy, docstring, warnings
+from ..internals import (
+    _not_none,
+    _pop_rc,
+    _version_cartopy,
+    benchmarks,
+    docstring,
+    warnings,
+)
 from . import plot
 
 try:
@@ -539,6 +546,7 @@ class GeoAxes(plot.PlotAxes):
         return array
 
     @docstring._snippet_manager
+    @benchmarks._benchmark_func('Axes.format')
     def format(
         self, *,
         extent=None, round=None,
@@ -4,11 +4,12 @@ The second-level axes subclass used for all proplot figures.
 Implements plotting method overrides.
 """
 import contextlib
+import functools
 import inspect
 import itertools
 import re
 import sys
-from numbers import Integral
+from numbers import Integral, Number
 
 import matplotlib.artist as martist
 import matplotlib.axes as maxes
@@ -20,6 +21,7 @@ import matplotlib.contour as mcontour
 import matplotlib.image as mimage
 import matplotlib.lines as mlines
 import matplotlib.patches as mpatches
+import matplotlib.path as mpath
 import matplotlib.ticker as mticker
 import numpy as np
 import numpy.ma as ma
@@ -34,10 +36,12 @@ from ..internals import (
     _pop_kwargs,
     _pop_params,
     _pop_props,
+    benchmarks,
     context,
     docstring,
     guides,
     inputs,
+    labels,
     warnings,
 )
 from . import base
@@ -420,7 +424,12 @@ labels : bool, optional
 labels_kw : dict-like, optional
     Ignored if `labels` is ``False``. Extra keyword args for the labels.
     For contour plots, this is passed to `~matplotlib.axes.Axes.clabel`.
-    Otherwise, this is passed to `~matplotlib.axes.Axes.text`.
+    Otherwise, this is passed to `~matplotlib.axes.Axes.text`. For contour
+    plots, ``labels_kw={'fast': True}`` places labels at the midpoints of the
+    longest contour segments and skips labels close to existing labels rather than
+    searching for the straightest part of each contour. This is much faster for
+    dense contours. ``labels_kw={'maxlabels': N}`` also limits the number
+    of labels per contour level to ``N`` (this implies ``'fast': True``).
 formatter, fmt : formatter-spec, optional
     The `~matplotlib.ticker.Formatter` used to format number labels.
     Passed to the `~proplot.constructor.Formatter` constructor.
@@ -435,6 +444,24 @@ docstring._snippet_manager['plot.labels_1d'] = _labels_1d_docstring
 docstring._snippet_manager['plot.labels_2d'] = _labels_2d_docstring
 
 
+# Downsampling docstring
+_downsample_docstring = """
+downsample : bool, int, or {'auto'}, optional
+    Whether to reduce blocks of grid boxes before plotting. This can greatly
+    reduce draw times and vector graphic file sizes for large arrays. If ``True``
+    or ``'auto'``, the data is reduced to roughly the number of pixels spanned by
+    the axes at :rc:`savefig.dpi`. If an integer, this is the size of the blocks.
+    Default is ``'auto'`` if the data is a `dask.array.Array` or lazily-loaded
+    `~xarray.DataArray` and ``False`` otherwise. Lazily-loaded data is only
+    loaded into memory after it is reduced. The default `vmin` and `vmax`
+    are always computed from the full-resolution data.
+downsample_method : {'mean', 'max', 'min', 'nearest'}, default: 'mean'
+    The method used to reduce each block. ``'nearest'`` selects the first grid
+    box in each block. Invalid data is ignored by the other methods.
+"""
+docstring._snippet_manager['plot.downsample'] = _downsample_docstring
+
+
 # Negative-positive colors
 _negpos_docstring = """
 negpos : bool, default: False
@@ -1027,7 +1054,7 @@ Other parameters
 %(plot.levels_manual)s
 %(plot.levels_auto)s
 %(artist.collection_contour)s{edgefix}
-%(plot.labels_2d)s
+%(plot.labels_2d)s{downsample}
 %(plot.guide)s
 **kwargs
     Passed to `matplotlib.axes.Axes.{command}`.
@@ -1041,16 +1068,20 @@ PlotAxes.tricontourf
 matplotlib.axes.Axes.{command}
 """
 docstring._snippet_manager['plot.contour'] = _contour_docstring.format(
-    descrip='contour lines', command='contour', edgefix=''
+    descrip='contour lines', command='contour', edgefix='',
+    downsample='\n%(plot.downsample)s',
 )
 docstring._snippet_manager['plot.contourf'] = _contour_docstring.format(
     descrip='filled contours', command='contourf', edgefix='%(axes.edgefix)s\n',
+    downsample='\n%(plot.downsample)s',
 )
 docstring._snippet_manager['plot.tricontour'] = _contour_docstring.format(
-    descrip='contour lines on a triangular grid', command='tricontour', edgefix=''
+    descrip='contour lines on a triangular grid', command='tricontour', edgefix='',
+    downsample='',
 )
 docstring._snippet_manager['plot.tricontourf'] = _contour_docstring.format(
-    descrip='filled contours on a triangular grid', command='tricontourf', edgefix='\n%(axes.edgefix)s'  # noqa: E501
+    descrip='filled contours on a triangular grid', command='tricontourf', edgefix='\n%(axes.edgefix)s',  # noqa: E501
+    downsample='',
 )
 
 
@@ -1072,7 +1103,7 @@ Other parameters
 %(plot.levels_auto)s
 %(artist.collection_pcolor)s
 %(axes.edgefix)s
-%(plot.labels_2d)s
+%(plot.labels_2d)s{downsample}
 %(plot.guide)s
 **kwargs
     Passed to `matplotlib.axes.Axes.{command}`.
@@ -1103,19 +1134,23 @@ aspect : {'equal', 'auto'} or float, default: :rc:`image.aspet`
       the layout. In general this results in non-square grid boxes.
 """.rstrip()
 docstring._snippet_manager['plot.pcolor'] = _pcolor_docstring.format(
-    descrip='irregular grid boxes', command='pcolor', aspect=''
+    descrip='irregular grid boxes', command='pcolor', aspect='',
+    downsample='\n%(plot.downsample)s',
 )
 docstring._snippet_manager['plot.pcolormesh'] = _pcolor_docstring.format(
-    descrip='regular grid boxes', command='pcolormesh', aspect=''
+    descrip='regular grid boxes', command='pcolormesh', aspect='',
+    downsample='\n%(plot.downsample)s',
 )
 docstring._snippet_manager['plot.pcolorfast'] = _pcolor_docstring.format(
-    descrip='grid boxes quickly', command='pcolorfast', aspect=''
+    descrip='grid boxes quickly', command='pcolorfast', aspect='',
+    downsample='\n%(plot.downsample)s',
 )
 docstring._snippet_manager['plot.tripcolor'] = _pcolor_docstring.format(
-    descrip='triangular grid boxes', command='tripcolor', aspect=''
+    descrip='triangular grid boxes', command='tripcolor', aspect='', downsample='',
 )
 docstring._snippet_manager['plot.heatmap'] = _pcolor_docstring.format(
-    descrip=_heatmap_descrip, command='pcolormesh', aspect=_heatmap_aspect
+    descrip=_heatmap_descrip, command='pcolormesh', aspect=_heatmap_aspect,
+    downsample='\n%(plot.downsample)s',
 )
 
 
@@ -1134,7 +1169,7 @@ Other parameters
 %(plot.cmap_norm)s
 %(plot.vmin_vmax)s
 %(plot.levels_manual)s
-%(plot.levels_auto)s
+%(plot.levels_auto)s{downsample}
 %(plot.guide)s
 **kwargs
     Passed to `matplotlib.axes.Axes.{command}`.
@@ -1145,13 +1180,13 @@ proplot.axes.PlotAxes
 matplotlib.axes.Axes.{command}
 """
 docstring._snippet_manager['plot.imshow'] = _show_docstring.format(
-    descrip='an image', command='imshow'
+    descrip='an image', command='imshow', downsample='\n%(plot.downsample)s'
 )
 docstring._snippet_manager['plot.matshow'] = _show_docstring.format(
-    descrip='a matrix', command='matshow'
+    descrip='a matrix', command='matshow', downsample='\n%(plot.downsample)s'
 )
 docstring._snippet_manager['plot.spy'] = _show_docstring.format(
-    descrip='a sparcity pattern', command='spy'
+    descrip='a sparcity pattern', command='spy', downsample=''
 )
 
 
@@ -1256,6 +1291,67 @@ def _inside_seaborn_call():
     return False
 
 
+def _place_contour_labels(cobj, inline=True, inline_spacing=5, maxlabels=None):
+    """
+    Add contour labels at the arc length midpoints of the longest contour segments.
+    Requires calling `~matplotlib.contour.ContourSet.clabel` beforehand.
+    """
+    # NOTE: Unlike matplotlib this skips locations too close to existing labels
+    # rather than falling back to the straightest part of the contour. So dense
+    # contours are labeled more sparsely and labels rarely overlap.
+    add_label = cobj.add_label_clabeltext if cobj._use_clabeltext else cobj.add_label
+    xys = np.empty((0, 2))
+    for idx, (icon, level, cvalue) in enumerate(zip(
+        cobj.labelIndiceList, cobj.labelLevelList, cobj.labelCValueList
+    )):
+        # Get the arc lengths for every segment in display coordinates at once
+        con = cobj.collections[icon]
+        paths = con.get_paths()
+        if not paths:
+            continue
+        if hasattr(cobj, '_get_nth_label_width'):
+            width = cobj._get_nth_label_width(idx)
+        else:  # matplotlib < 3.5
+            size = cobj.labelFontSizeList[idx]
+            width = cobj.get_label_width(level, cobj.labelFmt, size)
+            width *= con.figure.dpi / 72  # scale to screen coordinates
+        sizes = np.array([len(path.vertices) for path in paths])
+        ends = np.cumsum(sizes)
+        starts = ends - sizes
+        lc = np.concatenate([path.vertices for path in paths])
+        slc = con.get_transform().transform(lc)
+        arcs = np.append(0, np.cumsum(np.hypot(*np.diff(slc, axis=0).T)))
+        lengths = arcs[ends - 1] - arcs[starts]
+        centers = np.searchsorted(arcs, arcs[starts] + 0.5 * lengths)
+        centers = np.clip(centers, starts, ends - 1)
+
+        # Label the longest segments first and break them if requested
+        # NOTE: This uses the same minimum spacing between labels as matplotlib.
+        breaks = {}
+        order = np.argsort(-lengths, kind='stable')
+        for i in order[lengths[order] > 1.2 * width]:
+            if maxlabels is not None and len(breaks) >= maxlabels:
+                break
+            xy = slc[centers[i]]
+            if np.any(np.sum((xys - xy) ** 2, axis=1) < (1.2 * width) ** 2):
+                continue
+            xys = np.append(xys, xy[None, :], axis=0)
+            start, end = starts[i], ends[i]
+            rotation, segs = cobj.calc_label_rot_and_inline(
+                slc[start:end], centers[i] - start, width,
+                lc[start:end] if inline else None, inline_spacing,
+            )
+            add_label(*xy, rotation, level, cvalue)
+            breaks[i] = [mpath.Path(seg) for seg in segs if len(seg) > 1]
+        if inline and breaks:
+            paths[:] = [
+                seg for i, path in enumerate(paths)
+                for seg in breaks.get(i, (path,))
+            ]
+
+    return cbook.silent_list('text.Text', cobj.labelTexts)
+
+
 class PlotAxes(base.Axes):
     """
     The second lowest-level `~matplotlib.axes.Axes` subclass used by proplot.
@@ -1380,37 +1476,62 @@ class PlotAxes(base.Axes):
         kwargs.setdefault('ha', 'center')
         kwargs.setdefault('va', 'center')
 
-        # Apply colors and hide edge colors for empty grids
-        labs = []
-        array = obj.get_array()
-        paths = obj.get_paths()
+        # Get the label values and hide edge colors for empty grids
+        # NOTE: Round to the number corresponding to the *color* rather than
+        # the exact data value. Similar to contour label numbering.
+        values = ma.masked_invalid(np.ravel(obj.get_array()))
+        valid = ~ma.getmaskarray(values)
         edgecolors = inputs._to_numpy_array(obj.get_edgecolors())
         if len(edgecolors) == 1:
-            edgecolors = np.repeat(edgecolors, len(array), axis=0)
-        for i, (path, value) in enumerate(zip(paths, array)):
-            # Round to the number corresponding to the *color* rather than
-            # the exact data value. Similar to contour label numbering.
-            if value is ma.masked or not np.isfinite(value):
-                edgecolors[i, :] = 0
-                continue
-            if isinstance(obj.norm, pcolors.DiscreteNorm):
-                value = obj.norm._norm.inverse(obj.norm(value))
-            icolor = color
-            if color is None:
-                _, _, lum = utils.to_xyz(obj.cmap(obj.norm(value)), 'hcl')
-                icolor = 'w' if lum < 50 else 'k'
-            bbox = path.get_extents()
-            x = (bbox.xmin + bbox.xmax) / 2
-            y = (bbox.ymin + bbox.ymax) / 2
-            lab = self.text(x, y, fmt(value), color=icolor, size=fontsize, **kwargs)
-            labs.append(lab)
-
+            edgecolors = np.repeat(edgecolors, values.size, axis=0)
+        edgecolors[~valid, :] = 0
         obj.set_edgecolors(edgecolors)
-        return labs
+        values = values.compressed()
+        if isinstance(obj.norm, pcolors.DiscreteNorm):
+            values = obj.norm._norm.inverse(obj.norm(values))
+        values = np.asarray(values)
+        if not values.size:
+            return
+
+        # Get the label positions and colors
+        # NOTE: QuadMesh paths are generated on request so use the coordinates
+        # instead. Positions are the centers of the grid box extents.
+        coords = getattr(obj, '_coordinates', None)
+        if coords is not None:
+            corners = np.stack(
+                (coords[:-1, :-1], coords[:-1, 1:], coords[1:, :-1], coords[1:, 1:])
+            )
+        else:
+            paths = obj.get_paths()
+            if len({path.vertices.shape for path in paths}) <= 1:
+                corners = np.array([path.vertices for path in paths]).swapaxes(0, 1)
+            else:
+                corners = np.array([path.get_extents().get_points() for path in paths])
+                corners = corners.swapaxes(0, 1)
+        corners = corners.reshape((corners.shape[0], -1, 2))[:, valid, :]
+        x, y = (0.5 * (corners.min(axis=0) + corners.max(axis=0))).T
+        colors = color
+        if colors is None:
+            lums = utils._to_xyz_array(obj.cmap(obj.norm(values))[:, :3], 'hcl')[:, 2]
+            colors = np.where(lums < 50, 'w', 'k')
+        else:
+            colors = (colors,) * values.size
+
+        # Add the labels
+        texts = tuple(map(fmt, values))
+        obj = labels._TextCollection(
+            x, y, texts, colors, transform=self.transData, clip_on=False
+        )
+        obj.set_clip_path(self.patch)  # consistent with matplotlib text()
+        self._add_text(obj)
+        obj.update = labels._update_label.__get__(obj)
+        obj.update({'size': fontsize, **kwargs})
+        return obj
 
     def _add_contour_labels(
         self, obj, cobj, fmt, *, c=None, color=None, colors=None,
-        size=None, fontsize=None, inline_spacing=None, **kwargs
+        size=None, fontsize=None, inline_spacing=None, fast=None, maxlabels=None,
+        **kwargs
     ):
         """
         Add labels to contours with support for shade-dependent filled contour labels.
@@ -1424,6 +1545,7 @@ class PlotAxes(base.Axes):
         colors = _not_none(c=c, color=color, colors=colors)
         fontsize = _not_none(size=size, fontsize=fontsize, default=rc['font.smallsize'])
         inline_spacing = _not_none(inline_spacing, 2.5)
+        fast = _not_none(fast, maxlabels is not None)
 
         # Separate clabel args from text Artist args
         text_kw = {}
@@ -1435,16 +1557,38 @@ class PlotAxes(base.Axes):
         # Draw hidden additional contour for filled contour labels
         cobj = _not_none(cobj, obj)
         if obj.filled and colors is None:
-            colors = []
-            for level in obj.levels:
-                _, _, lum = utils.to_xyz(obj.cmap(obj.norm(level)))
-                colors.append('w' if lum < 50 else 'k')
+            levels = np.asarray(obj.levels)
+            lums = utils._to_xyz_array(obj.cmap(obj.norm(levels))[:, :3], 'hcl')[:, 2]
+            colors = np.where(lums < 50, 'w', 'k').tolist()
+
+        # Format the level labels
+        # NOTE: Matplotlib formats the entire list of levels each time it formats
+        # a single label. Here pass a dictionary of the formatted labels instead.
+        # Formatter.format_ticks() was added in matplotlib 3.1.
+        if isinstance(fmt, mticker.Formatter) and hasattr(fmt, 'format_ticks'):
+            levels = list(cobj.levels)
+            if kwargs.get('levels', None) is not None:
+                subset = list(kwargs['levels'])
+                levels = [level for level in levels if level in subset]
+            fmt = dict(zip(levels, fmt.format_ticks(levels)))
 
         # Draw the labels
-        labs = cobj.clabel(
-            fmt=fmt, colors=colors, fontsize=fontsize,
-            inline_spacing=inline_spacing, **kwargs
-        )
+        # NOTE: Calling clabel() with empty 'manual' positions sets up the label
+        # properties without placing the labels.
+        if fast and kwargs.get('manual', False) is False:
+            inline = kwargs.pop('inline', True)
+            labs = cobj.clabel(
+                fmt=fmt, colors=colors, fontsize=fontsize, manual=(), **kwargs
+            )
+            labs = _place_contour_labels(
+                cobj, inline=inline, inline_spacing=inline_spacing,
+                maxlabels=maxlabels,
+            )
+        else:
+            labs = cobj.clabel(
+                fmt=fmt, colors=colors, fontsize=fontsize,
+                inline_spacing=inline_spacing, **kwargs
+            )
         if labs is not None:  # returns None if no contours
             for lab in labs:
                 lab.update(text_kw)
@@ -1711,6 +1855,34 @@ class PlotAxes(base.Axes):
         else:
             warnings._warn_proplot(f'Unexpected obj {obj} passed to _fix_patch_edges.')
 
+    @staticmethod
+    def _fix_discrete_colors(obj):
+        """
+        Map data directly to colors when drawing with a `~proplot.colors.DiscreteNorm`
+        rather than normalizing the data then looking up colors in the colormap.
+        """
+        # NOTE: Matplotlib calls to_rgba() on draw for collections, so this only
+        # helps pcolormesh and heatmap. Images are normalized and resampled before
+        # calling to_rgba(..., norm=False), so imshow never reaches this path. Use
+        # partial() rather than a closure so the figure can still be pickled. Falls
+        # back if the norm or data are changed.
+        if isinstance(obj.norm, pcolors.DiscreteNorm):
+            obj.to_rgba = functools.partial(PlotAxes._to_rgba_discrete, obj)
+
+    @staticmethod
+    def _to_rgba_discrete(obj, x, alpha=None, bytes=False, norm=True):
+        """
+        Return colors for the data using `~proplot.colors.DiscreteNorm` if possible.
+        """
+        if (
+            norm
+            and isinstance(obj.norm, pcolors.DiscreteNorm)
+            and getattr(x, 'ndim', None) in (1, 2)
+            and np.ndim(alpha) == 0
+        ):
+            return obj.norm._to_rgba(x, obj.cmap, alpha=alpha, bytes=bytes)
+        return type(obj).to_rgba(obj, x, alpha=alpha, bytes=bytes, norm=norm)
+
     @contextlib.contextmanager
     def _keep_grid_bools(self):
         """
@@ -1745,6 +1917,38 @@ class PlotAxes(base.Axes):
             extents = list(self.dataLim.extents)  # ensure modifiable
         return kwargs, extents
 
+    def _decimate_2d(self, x, y, *zs, downsample=None, downsample_method=None):
+        """
+        Reduce the sample data to roughly the resolution of the saved figure
+        and load lazily-loaded sample data into memory.
+        """
+        lazy = any(map(inputs._is_lazy, zs))
+        downsample = _not_none(downsample, 'auto' if lazy else False)
+        method = _not_none(downsample_method, 'mean')
+        if downsample is False or np.ndim(zs[0]) < 2:
+            steps = (1, 1)
+        elif downsample is True or downsample == 'auto':
+            fig = self.figure
+            dpi = rc['savefig.dpi']
+            dpi = max(dpi, fig.dpi) if isinstance(dpi, Number) else fig.dpi
+            width, height = np.ceil(self._get_size_inches() * dpi)
+            ny, nx = np.shape(zs[0])[:2]
+            steps = (max(1, int(ny // height)), max(1, int(nx // width)))
+        elif isinstance(downsample, Integral) and downsample > 0:
+            steps = (downsample, downsample)
+        else:
+            raise ValueError(
+                f'Invalid downsample={downsample!r}. Must be boolean, '
+                "'auto', or a positive integer."
+            )
+        if steps != (1, 1):
+            zs = tuple(inputs._to_numpy_array(z, lazy=True) for z in zs)
+            return inputs._to_decimated(x, y, *zs, steps=steps, method=method)
+        elif lazy:
+            return (x, y, *map(inputs._to_numpy_array, zs))
+        else:
+            return (x, y, *zs)
+
     def _inbounds_vlim(self, x, y, z, *, to_centers=False):
         """
         Restrict the sample data used for automatic `vmin` and `vmax` selection
@@ -1771,7 +1975,7 @@ class PlotAxes(base.Axes):
                 ymask = (y >= min(ylim)) & (y <= max(ylim))
             # Get subsample
             if xmask is not None and ymask is not None:
-                z = z[np.ix_(ymask, xmask)] if z.ndim == 2 and xmask.ndim == 1 else z[ymask & xmask]  # noqa: E501
+                z = z[ymask, :][:, xmask] if z.ndim == 2 and xmask.ndim == 1 else z[ymask & xmask]  # noqa: E501
             elif xmask is not None:
                 z = z[:, xmask] if z.ndim == 2 and xmask.ndim == 1 else z[xmask]
             elif ymask is not None:
@@ -1966,12 +2170,14 @@ class PlotAxes(base.Axes):
             x = inputs._to_numpy_array(x)
         return (x, *ys, kwargs)
 
+    @benchmarks._benchmark_func('_parse_2d_args')
     def _parse_2d_args(
         self, x, y, *zs, globe=False, edges=False, allow1d=False,
-        transpose=None, order=None, **kwargs
+        transpose=None, order=None, lazy=False, **kwargs
     ):
         """
-        Interpret positional arguments for all 2D plotting commands.
+        Interpret positional arguments for all 2D plotting commands. If `lazy`
+        is ``True`` then dask arrays are returned without computing them.
         """
         # Standardize values
         # NOTE: Functions pass two 'zs' at most right now
@@ -1996,7 +2202,7 @@ class PlotAxes(base.Axes):
                 x = x.T
             if y is not None:
                 y = y.T
-        x, y, *zs, kwargs = self._parse_2d_format(x, y, *zs, **kwargs)
+        x, y, *zs, kwargs = self._parse_2d_format(x, y, *zs, lazy=lazy, **kwargs)
         if edges:
             # NOTE: These functions quitely pass through 1D inputs, e.g. barb data
             x, y = inputs._to_edges(x, y, zs[0])
@@ -2004,6 +2210,9 @@ class PlotAxes(base.Axes):
             x, y = inputs._to_centers(x, y, zs[0])
 
         # Geographic corrections
+        # NOTE: Lazy arrays are computed here because these modify the data values.
+        if lazy and not allow1d and (globe or self._name == 'basemap'):
+            zs = tuple(map(inputs._to_numpy_array, zs))
         if allow1d:
             pass
         elif self._name == 'cartopy' and isinstance(kwargs.get('transform'), PlateCarree):  # noqa: E501
@@ -2016,7 +2225,8 @@ class PlotAxes(base.Axes):
         return (x, y, *zs, kwargs)
 
     def _parse_2d_format(
-        self, x, y, *zs, autoformat=None, autoguide=True, autoreverse=True, **kwargs
+        self, x, y, *zs, autoformat=None, autoguide=True, autoreverse=True,
+        lazy=False, **kwargs
     ):
         """
         Try to retrieve default coordinates from array-like objects and apply default
@@ -2068,7 +2278,7 @@ class PlotAxes(base.Axes):
         # Finally strip metadata
         x = inputs._to_numpy_array(x)
         y = inputs._to_numpy_array(y)
-        zs = tuple(map(inputs._to_numpy_array, zs))
+        zs = tuple(inputs._to_numpy_array(z, lazy=lazy) for z in zs)
         return (x, y, *zs, kwargs)
 
     def _parse_color(self, x, y, c, *, apply_cycle=True, infer_rgb=False, **kwargs):
@@ -2098,6 +2308,7 @@ class PlotAxes(base.Axes):
         return (c, kwargs)
 
     @warnings._rename_kwargs('0.6.0', centers='values')
+    @benchmarks._benchmark_func('_parse_cmap')
     def _parse_cmap(
         self, *args,
         cmap=None, cmap_kw=None, c=None, color=None, colors=None,
@@ -2400,6 +2611,7 @@ class PlotAxes(base.Axes):
         # but in future could make this public as a way for users (me) to get
         # automatic synced contours for a bunch of arrays in a grid.
         vmins, vmaxs = [], []
+        sample = rc['cmap.robust_sample']
         if len(args) > 2:
             x, y, *zs = args
         else:
@@ -2409,10 +2621,10 @@ class PlotAxes(base.Axes):
                 continue
             if z.ndim > 2:  # e.g. imshow data
                 continue
-            z = inputs._to_numpy_array(z)
+            z = inputs._to_numpy_array(z, lazy=True)
             if inbounds and x is not None and y is not None:  # ignore if None coords
                 z = self._inbounds_vlim(x, y, z, to_centers=to_centers)
-            imin, imax = inputs._safe_range(z, pmin, pmax)
+            imin, imax = inputs._safe_range(z, pmin, pmax, sample=sample)
             if automin and imin is not None:
                 vmins.append(imin)
             if automax and imax is not None:
@@ -2567,6 +2779,7 @@ class PlotAxes(base.Axes):
 
         return levels, kwargs
 
+    @benchmarks._benchmark_func('_parse_level_vals')
     def _parse_level_vals(
         self, *args, N=None, levels=None, values=None, extend=None,
         positive=False, negative=False, nozero=False, norm=None, norm_kw=None,
@@ -3836,11 +4049,13 @@ class PlotAxes(base.Axes):
         """
         %(plot.contour)s
         """
-        x, y, z, kw = self._parse_2d_args(x, y, z, **kwargs)
+        x, y, z, kw = self._parse_2d_args(x, y, z, lazy=True, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(
             x, y, z, min_levels=1, plot_lines=True, plot_contours=True, **kw
         )
+        decimate_kw = _pop_params(kw, self._decimate_2d)
+        x, y, z = self._decimate_2d(x, y, z, **decimate_kw)
         labels_kw = _pop_params(kw, self._add_auto_labels)
         guide_kw = _pop_params(kw, self._update_guide)
         label = kw.pop('label', None)
@@ -3857,9 +4072,11 @@ class PlotAxes(base.Axes):
         """
         %(plot.contourf)s
         """
-        x, y, z, kw = self._parse_2d_args(x, y, z, **kwargs)
+        x, y, z, kw = self._parse_2d_args(x, y, z, lazy=True, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(x, y, z, plot_contours=True, **kw)
+        decimate_kw = _pop_params(kw, self._decimate_2d)
+        x, y, z = self._decimate_2d(x, y, z, **decimate_kw)
         contour_kw = _pop_kwargs(kw, 'edgecolors', 'linewidths', 'linestyles')
         edgefix_kw = _pop_params(kw, self._fix_patch_edges)
         labels_kw = _pop_params(kw, self._add_auto_labels)
@@ -3881,9 +4098,11 @@ class PlotAxes(base.Axes):
         """
         %(plot.pcolor)s
         """
-        x, y, z, kw = self._parse_2d_args(x, y, z, edges=True, **kwargs)
+        x, y, z, kw = self._parse_2d_args(x, y, z, edges=True, lazy=True, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(x, y, z, to_centers=True, **kw)
+        decimate_kw = _pop_params(kw, self._decimate_2d)
+        x, y, z = self._decimate_2d(x, y, z, **decimate_kw)
         edgefix_kw = _pop_params(kw, self._fix_patch_edges)
         labels_kw = _pop_params(kw, self._add_auto_labels)
         guide_kw = _pop_params(kw, self._update_guide)
@@ -3901,15 +4120,18 @@ class PlotAxes(base.Axes):
         """
         %(plot.pcolormesh)s
         """
-        x, y, z, kw = self._parse_2d_args(x, y, z, edges=True, **kwargs)
+        x, y, z, kw = self._parse_2d_args(x, y, z, edges=True, lazy=True, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(x, y, z, to_centers=True, **kw)
+        decimate_kw = _pop_params(kw, self._decimate_2d)
+        x, y, z = self._decimate_2d(x, y, z, **decimate_kw)
         edgefix_kw = _pop_params(kw, self._fix_patch_edges)
         labels_kw = _pop_params(kw, self._add_auto_labels)
         guide_kw = _pop_params(kw, self._update_guide)
         with self._keep_grid_bools():
             m = self._call_native('pcolormesh', x, y, z, **kw)
         self._fix_patch_edges(m, **edgefix_kw, **kw)
+        self._fix_discrete_colors(m)
         self._add_auto_labels(m, **labels_kw)
         self._update_guide(m, queue_colorbar=False, **guide_kw)
         return m
@@ -3921,9 +4143,11 @@ class PlotAxes(base.Axes):
         """
         %(plot.pcolorfast)s
         """
-        x, y, z, kw = self._parse_2d_args(x, y, z, edges=True, **kwargs)
+        x, y, z, kw = self._parse_2d_args(x, y, z, edges=True, lazy=True, **kwargs)
         kw.update(_pop_props(kw, 'collection'))
         kw = self._parse_cmap(x, y, z, to_centers=True, **kw)
+        decimate_kw = _pop_params(kw, self._decimate_2d)
+        x, y, z = self._decimate_2d(x, y, z, **decimate_kw)
         edgefix_kw = _pop_params(kw, self._fix_patch_edges)
         labels_kw = _pop_params(kw, self._add_auto_labels)
         guide_kw = _pop_params(kw, self._update_guide)
@@ -4124,6 +4348,14 @@ class PlotAxes(base.Axes):
         """
         kw = kwargs.copy()
         kw = self._parse_cmap(z, default_discrete=False, **kw)
+        decimate_kw = _pop_params(kw, self._decimate_2d)
+        shape = np.shape(z)
+        _, _, z = self._decimate_2d(None, None, z, **decimate_kw)
+        if np.shape(z) != shape and kw.get('extent', None) is None:
+            ny, nx = shape[:2]  # preserve the full-resolution pixel coordinates
+            origin = _not_none(kw.get('origin', None), rc['image.origin'])
+            ylim = (ny - 0.5, -0.5) if origin == 'upper' else (-0.5, ny - 0.5)
+            kw['extent'] = (-0.5, nx - 0.5, *ylim)
         guide_kw = _pop_params(kw, self._update_guide)
         m = self._call_native('imshow', z, **kw)
         self._update_guide(m, queue_colorbar=False, **guide_kw)
@@ -11,7 +11,7 @@ from .. import constructor
 from .. import ticker as pticker
 from ..config import rc
 from ..internals import ic  # noqa: F401
-from ..internals import _not_none, _pop_rc, docstring
+from ..internals import _not_none, _pop_rc, benchmarks, docstring
 from . import plot, shared
 
 __all__ = ['PolarAxes']
@@ -196,6 +196,7 @@ class PolarAxes(shared._SharedAxes, plot.PlotAxes, mpolar.PolarAxes):
                 axis.set_minor_locator(loc)
 
     @docstring._snippet_manager
+    @benchmarks._benchmark_func('Axes.format')
     def format(
         self, *, r0=None, theta0=None, thetadir=None,
         thetamin=None, thetamax=None, thetalim=None,
@@ -38,7 +38,16 @@ from .internals import (
     inputs,
     warnings,
 )
-from .utils import set_alpha, to_hex, to_rgb, to_rgba, to_xyz, to_xyza
+from .utils import (
+    _to_rgb_array,
+    _to_xyz_array,
+    set_alpha,
+    to_hex,
+    to_rgb,
+    to_rgba,
+    to_xyz,
+    to_xyza,
+)
 
 __all__ = [
     'DiscreteColormap',
@@ -629,7 +638,6 @@ def _standardize_colors(input, space, margin):
     """
     output = {}
     colors = []
-    channels = []
 
     # Always add these colors and ignore other colors that are too close
     # We do this for colors with nice names or that proplot devs really like
@@ -640,7 +648,6 @@ def _standardize_colors(input, space, margin):
         if 'grey' in name:
             name = name.replace('grey', 'gray')
         colors.append((name, color))
-        channels.append(to_xyz(color, space=space))
         output[name] = color  # required in case "kept" colors are close to each other
 
     # Translate remaining colors and remove bad names
@@ -654,12 +661,13 @@ def _standardize_colors(input, space, margin):
         if name in output:
             continue  # prioritize names that come first
         colors.append((name, color))  # category name pair
-        channels.append(to_xyz(color, space=space))
 
     # Get locations of "perceptually distinct" colors
-    channels = np.asarray(channels)
-    if not channels.size:
+    # NOTE: Translate all colors at once rather than calling to_xyz for each color
+    if not colors:
         return output
+    channels = mcolors.to_rgba_array([color for _, color in colors])[:, :3]
+    channels = _to_xyz_array(channels, space)
     channels = channels / np.array([360, 100, 100])
     channels = np.round(channels / margin).astype(np.int64)
     _, idxs = np.unique(channels, return_index=True, axis=0)
@@ -769,6 +777,52 @@ class _Colormap(object):
         """
         Read generalized colormap and color cycle files.
         """
+        data = cls._load_file(path, warn_on_failure=warn_on_failure)
+        if data is not None:
+            return cls._from_data(**data)
+
+    @classmethod
+    def _from_data(cls, name, coords=None, colors=None, text=None, N=None):
+        """
+        Build the colormap or color cycle from data returned by `_load_file`.
+        The lookup table size `N` is ignored for color cycles.
+        """
+        # Build colormap from segmentdata json file
+        if text is not None:
+            data = json.loads(text)
+            kw = {}
+            for key in ('cyclic', 'gamma', 'gamma1', 'gamma2', 'space'):
+                if key in data:
+                    kw[key] = data.pop(key, None)
+            if 'red' in data:
+                cmap = ContinuousColormap(name, data, N=N)
+            else:
+                cmap = PerceptualColormap(name, data, N=N, **kw)
+            if name[-2:] == '_r':
+                cmap = cmap.reversed(name[:-2])
+            return cmap
+
+        # Build colormap from table of colors
+        # NOTE: This is equivalent to ContinuousColormap.from_list() but skips the
+        # color sanitization already applied by _load_file.
+        if coords is None:
+            return DiscreteColormap(colors, name)
+        if len(coords) == 1:
+            coords, colors = (0, 1), np.repeat(colors, 2, axis=0)
+        keys = ('red', 'green', 'blue', 'alpha')
+        cdict = {
+            key: np.column_stack((coords, values, values))
+            for key, values in zip(keys, np.transpose(colors))
+        }
+        return ContinuousColormap(name, cdict, N=N)
+
+    @classmethod
+    def _load_file(cls, path, warn_on_failure=False):
+        """
+        Read generalized colormap and color cycle files and return keyword
+        arguments for `_from_data`. For tables of colors these are numpy arrays
+        of coordinates and colors, and for segmentdata files this is the json text.
+        """
         path = os.path.expanduser(path)
         name, ext = os.path.splitext(os.path.basename(path))
         listed = issubclass(cls, mcolors.ListedColormap)
@@ -786,27 +840,18 @@ class _Colormap(object):
             return _warn_or_raise('File not found.', FileNotFoundError)
 
         # Directly read segmentdata json file
-        # NOTE: This is special case! Immediately return name and cmap
+        # NOTE: This is special case! Immediately return name and text
         ext = ext[1:]
         if ext == 'json':
             if listed:
                 return _warn_or_raise('Cannot load cycles from JSON files.')
+            with open(path, 'r') as fh:
+                text = fh.read()
             try:
-                with open(path, 'r') as fh:
-                    data = json.load(fh)
+                json.loads(text)
             except json.JSONDecodeError:
                 return _warn_or_raise('JSON decoding error.', json.JSONDecodeError)
-            kw = {}
-            for key in ('cyclic', 'gamma', 'gamma1', 'gamma2', 'space'):
-                if key in data:
-                    kw[key] = data.pop(key, None)
-            if 'red' in data:
-                cmap = ContinuousColormap(name, data)
-            else:
-                cmap = PerceptualColormap(name, data, **kw)
-            if reversed:
-                cmap = cmap.reversed(name[:-2])
-            return cmap
+            return {'name': name, 'text': text}
 
         # Read .rgb and .rgba files
         if ext in ('txt', 'rgb'):
@@ -901,10 +946,11 @@ class _Colormap(object):
             data = data[::-1, :]
             x = 1 - x[::-1]
         if listed:
-            return DiscreteColormap(data, name)
+            return {'name': name, 'colors': data}
         else:
-            data = [(x, color) for x, color in zip(x, data)]
-            return ContinuousColormap.from_list(name, data)
+            alpha = data[:, 3] if data.shape[1] == 4 else np.ones(data.shape[0])
+            data = np.column_stack((_to_rgb_array(data[:, :3]), alpha))  # as in to_rgba
+            return {'name': name, 'coords': x, 'colors': data}
 
 
 class ContinuousColormap(mcolors.LinearSegmentedColormap, _Colormap):
@@ -1979,8 +2025,8 @@ class PerceptualColormap(ContinuousColormap):
         self._isinit = True
 
         # Now convert values to RGB and clip colors
-        for i in range(self.N + 3):
-            self._lut[i, :3] = to_rgb(self._lut[i, :3], self._space)
+        # NOTE: Convert the entire table at once rather than looping over rows
+        self._lut[:, :3] = _to_rgb_array(self._lut[:, :3], self._space)
         self._lut[:, :3] = _clip_colors(self._lut[:, :3], self._clip)
 
     @docstring._snippet_manager
@@ -2495,8 +2541,28 @@ class DiscreteNorm(mcolors.BoundaryNorm):
         clip : bool, default: ``self.clip``
             Whether to clip values falling outside of the level bins.
         """
+        xq, index, is_scalar = self._get_index(value, clip=clip)
+        data = ma.getdata(xq)  # reuse the copy from process_value()
+        out = data if data.dtype == self._dest.dtype else None
+        yq = np.take(self._dest, index, out=out, mode='clip')  # avoid buffering
+        del index
+        if self.descending:
+            np.subtract(1, yq, out=yq)
+        yq = ma.array(yq, mask=ma.getmask(xq), copy=False)
+        if is_scalar:
+            yq = np.atleast_1d(yq)[0]
+        return yq
+
+    def _get_index(self, value, clip=None):
+        """
+        Return the processed data, the indices of the level bins containing
+        the data, and whether the input was scalar.
+        """
         # Follow example of SegmentedNorm, but perform no interpolation,
         # just use searchsorted to bin the data.
+        # NOTE: Here process_value() always returns a copy. Reuse its data buffer
+        # for each step rather than allocating full-size temporaries. Linear
+        # normalization is applied in-place as in Normalize.__call__().
         norm_clip = self._norm_clip
         if norm_clip:  # special extra clipping due to normalizer
             value = np.clip(value, *norm_clip)
@@ -2505,14 +2571,36 @@ class DiscreteNorm(mcolors.BoundaryNorm):
         if clip:  # note that np.clip can handle masked arrays
             value = np.clip(value, self._bmin, self._bmax)
         xq, is_scalar = self.process_value(value)
-        xq = self._norm(xq)
-        yq = self._dest[np.searchsorted(self._bins, xq)]
-        yq = ma.array(yq, mask=ma.getmask(xq))
+        data = ma.getdata(xq)
+        norm = self._norm
+        if type(norm) is mcolors.Normalize and not norm.clip and norm.vmin < norm.vmax:
+            data -= norm.vmin
+            data /= norm.vmax - norm.vmin
+            index = np.searchsorted(self._bins, data)
+        else:
+            yq = norm(xq)
+            index = np.searchsorted(self._bins, ma.getdata(yq))
+            xq = ma.array(data, mask=ma.getmask(yq), copy=False)
+        return xq, index, is_scalar
+
+    def _to_rgba(self, value, cmap, alpha=None, bytes=False):
+        """
+        Return the colormap colors for the data. This is equivalent to
+        ``cmap(norm(value))`` but the color for each level bin is only looked
+        up once, then the data are mapped straight to colors with `numpy.take`.
+        """
+        xq, index, is_scalar = self._get_index(value)
+        mask = ma.getmask(xq)
+        coords = 1 - self._dest if self.descending else self._dest
+        coords = ma.masked_array(np.append(coords, 0), mask=False)
+        coords[-1] = ma.masked  # the "bad" color
+        table = cmap(coords, alpha=alpha, bytes=bytes)
+        if mask is not ma.nomask:
+            index[mask] = table.shape[0] - 1
+        rgba = np.take(table, index, axis=0, mode='clip')
         if is_scalar:
-            yq = np.atleast_1d(yq)[0]
-        if self.descending:
-            yq = 1 - yq
-        return yq
+            rgba = tuple(rgba[0])
+        return rgba
 
     def inverse(self, value):  # noqa: U100
         """
@@ -2928,6 +3016,7 @@ class ColorDatabase(MutableMapping, dict):
         key = self._parse_key(key)
         dict.__delitem__(self, key)
         self.cache.clear()
+        self._generation += 1
 
     def __init__(self, mapping=None):
         """
@@ -2938,6 +3027,7 @@ class ColorDatabase(MutableMapping, dict):
         """
         # NOTE: Tested with and without standardization and speedup is marginal
         self._cache = _ColorCache()
+        self._generation = 0  # incremented when colors change
         mapping = mapping or {}
         for key, value in mapping.items():
             self.__setitem__(key, value)
@@ -2968,6 +3058,7 @@ class ColorDatabase(MutableMapping, dict):
         key = self._parse_key(key)
         dict.__setitem__(self, key, value)
         self.cache.clear()
+        self._generation += 1
 
     def _parse_key(self, key):
         """
@@ -2988,6 +3079,38 @@ class ColorDatabase(MutableMapping, dict):
         return self._cache
 
 
+class _LazyColormap(object):
+    """
+    Placeholder for a colormap or color cycle registered from a file. Stores the
+    data parsed from the file and builds the colormap on first retrieval from the
+    `ColormapDatabase`. Most sessions only use a few of the registered colormaps.
+    """
+    def __init__(self, cls, data):
+        name = data['name']
+        if 'text' in data and name[-2:] == '_r':  # reversed by _from_data
+            name = name[:-2]
+        self.name = name
+        self._cls = cls
+        self._data = data
+        self._cyclic = False
+        self._N = rc['image.lut']  # use the lookup table size on registration
+
+    def _build(self):
+        """
+        Build the colormap from the parsed file data.
+        """
+        cmap = self._cls._from_data(N=self._N, **self._data)
+        if self._cyclic:
+            cmap.set_cyclic(True)
+        return cmap
+
+    def set_cyclic(self, b):
+        """
+        Set whether the colormap will be cyclic when it is built.
+        """
+        self._cyclic = bool(b)
+
+
 class ColormapDatabase(MutableMapping, dict):
     """
     Dictionary subclass used to replace the matplotlib
@@ -3006,6 +3129,7 @@ class ColormapDatabase(MutableMapping, dict):
     def __delitem__(self, key):
         key = self._parse_key(key, mirror=True)
         dict.__delitem__(self, key)
+        self._generation += 1
 
     def __init__(self, kwargs):
         """
@@ -3014,6 +3138,7 @@ class ColormapDatabase(MutableMapping, dict):
         kwargs : dict-like
             The source dictionary.
         """
+        self._generation = 0  # incremented when public colormaps change
         for key, value in kwargs.items():
             self.__setitem__(key, value)
 
@@ -3107,7 +3232,7 @@ class ColormapDatabase(MutableMapping, dict):
         reverse = key[-2:] == '_r' and not self._has_item(key)
         if reverse:
             key = key[:-2]
-        # Retrieve colormap
+        # Retrieve colormap and build it if necessary
         try:
             value = dict.__getitem__(self, key)  # may raise keyerror
         except KeyError:
@@ -3116,6 +3241,9 @@ class ColormapDatabase(MutableMapping, dict):
                 + ', '.join(map(repr, self))
                 + '.'
             )
+        if isinstance(value, _LazyColormap):
+            value = _translate_cmap(value._build())
+            dict.__setitem__(self, key, value)
         # Modify colormap
         if reverse:
             value = value.reversed()
@@ -3129,11 +3257,18 @@ class ColormapDatabase(MutableMapping, dict):
         """
         if not isinstance(key, str):
             raise KeyError(f'Invalid key {key!r}. Must be string.')
-        if not isinstance(value, mcolors.Colormap):
+        if not isinstance(value, (mcolors.Colormap, _LazyColormap)):
             raise ValueError('Object is not a colormap.')
         key = self._translate_key(key, mirror=False)
-        value = _translate_cmap(value)
+        if not isinstance(value, _LazyColormap):  # translated when built
+            value = _translate_cmap(value)
+        prev = dict.get(self, key, None)
         dict.__setitem__(self, key, value)
+        if key[:1] == '_':  # ignore names generated by Colormap()
+            return
+        if isinstance(prev, mcolors.Colormap) and prev == value:
+            return  # ignore identical colormaps (e.g. repeated Colormap() calls)
+        self._generation += 1
 
 
 # Initialize databases
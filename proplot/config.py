@@ -10,9 +10,9 @@ See the :ref:`configuration guide <ug_config>` for details.
 # Because I think it makes sense to have all the code that "runs" (i.e. not
 # just definitions) in the same place, and I was having issues with circular
 # dependencies and where import order of __init__.py was affecting behavior.
+import json
 import logging
 import os
-import re
 import sys
 from collections import namedtuple
 from collections.abc import MutableMapping
@@ -34,6 +34,7 @@ from .internals import (
     _pop_props,
     _translate_grid,
     _version_mpl,
+    cache,
     docstring,
     rcsetup,
     warnings,
@@ -214,6 +215,144 @@ def _iter_data_objects(folder, *args, **kwargs):
             raise FileNotFoundError(f'Invalid file path {path!r}.')
 
 
+def _load_cmap_data(folder, cls, *args, **kwargs):
+    """
+    Return data parsed from colormap or color cycle files that should be registered.
+    Also return an index indicating whether these are user files. Parsed data from
+    files in the data folders is cached in `Configurator.user_folder` and reused
+    until the files are modified, added, or removed.
+    """
+    # Decode the cache. Parsed data is stored as a manifest of names, json text,
+    # and offsets into concatenated coordinate and color arrays.
+    path_cache = os.path.join(Configurator.user_folder('cache'), folder + '.npz')
+    key = cache._get_cache_key(folder)
+    arrays = cache._load_cache(path_cache, key)
+    entries = {}
+    if arrays is not None:
+        manifest = json.loads(str(arrays['manifest']))
+        for path, (stamp, name, text, start, stop, ncols, listed) in manifest.items():
+            data = {'name': name}
+            if text is not None:
+                data['text'] = text
+            else:
+                data['colors'] = arrays['colors'][start:stop, :ncols]
+                if not listed:
+                    data['coords'] = arrays['coords'][start:stop]
+            entries[path] = (stamp, data)
+
+    # Parse files that were modified or added since the cache was saved
+    # NOTE: Files passed as input arguments are never cached
+    changed = arrays is None
+    nfolders = len(_get_data_folders(folder, **kwargs))
+    loaded = []
+    for i, path in _iter_data_objects(folder, *args, **kwargs):
+        if i >= nfolders:
+            data = cls._load_file(path, warn_on_failure=True)
+        else:
+            stamp = cache._get_file_stamp(path)
+            stamp_cache, data = entries.get(path, (None, None))
+            if stamp != stamp_cache:
+                data = cls._load_file(path, warn_on_failure=True)
+                changed = True
+                if data is None:  # do not cache failures
+                    entries.pop(path, None)
+                else:
+                    entries[path] = (stamp, data)
+        if data is not None:
+            loaded.append((i, data))
+
+    # Encode and save the cache
+    if changed:
+        manifest, coords, colors = {}, [], []
+        start = 0
+        for path, (stamp, data) in entries.items():
+            if not os.path.isfile(path):
+                continue
+            text, stop, ncols = data.get('text', None), start, 0
+            if text is None:
+                ncols = data['colors'].shape[1]
+                stop = start + data['colors'].shape[0]
+                ipad = np.full((stop - start, 4 - ncols), np.nan)
+                icoords = data.get('coords', np.full(stop - start, np.nan))
+                colors.append(np.hstack((data['colors'], ipad)))
+                coords.append(icoords)
+            listed = 'coords' not in data
+            manifest[path] = (stamp, data['name'], text, start, stop, ncols, listed)
+            start = stop
+        cache._save_cache(
+            path_cache,
+            key,
+            manifest=np.array(json.dumps(manifest)),
+            coords=np.concatenate(coords or [np.empty(0)]),
+            colors=np.concatenate(colors or [np.empty((0, 4))]),
+        )
+
+    return loaded
+
+
+def _load_distinct_colors(path, space, margin):
+    """
+    Return the "perceptually distinct" colors from the color file. The result is
+    cached in `Configurator.user_folder` and reused until the file is modified
+    or the filtering settings are changed.
+    """
+    from . import colors as pcolors
+    keep = {key: pcolors._color_database[key] for key in COLORS_KEEP}
+    stamp = cache._get_file_stamp(path)
+    path_cache = os.path.join(Configurator.user_folder('cache'), 'colors.npz')
+    key = cache._get_cache_key('colors', path, stamp, space, margin, keep)
+    arrays = cache._load_cache(path_cache, key)
+    if arrays is not None:
+        return dict(zip(arrays['names'].tolist(), arrays['colors'].tolist()))
+    loaded = pcolors._load_colors(path, warn_on_failure=True)
+    loaded.update(keep)  # keep the same
+    loaded = pcolors._standardize_colors(loaded, space, margin)
+    if all(isinstance(color, str) for color in loaded.values()):
+        cache._save_cache(
+            path_cache,
+            key,
+            names=np.array(list(loaded.keys())),
+            colors=np.array(list(loaded.values())),
+        )
+    return loaded
+
+
+def _load_font_entries(paths):
+    """
+    Add the font files to the matplotlib font manager and return whether any files
+    had to be parsed. Font properties are cached in `Configurator.user_folder`
+    and reused until the files are modified, added, or removed.
+    """
+    # NOTE: Parsing the proplot font files with FontManager.addfont is slow, so
+    # we store the FontEntry properties and rebuild the entries from the cache.
+    fields = ('fname', 'name', 'style', 'variant', 'weight', 'stretch', 'size')
+    path_cache = os.path.join(Configurator.user_folder('cache'), 'fonts.npz')
+    key = cache._get_cache_key('fonts', getattr(mfonts.FontManager, '__version__', 0))
+    arrays = cache._load_cache(path_cache, key)
+    entries = {}
+    if arrays is not None:
+        entries = json.loads(str(arrays['manifest']))
+    parsed = False
+    manager = mfonts.fontManager
+    for path in paths:
+        afm = os.path.splitext(path)[1].lower() == '.afm'
+        fonts = manager.afmlist if afm else manager.ttflist
+        stamp = cache._get_file_stamp(path)
+        stamp_cache, props = entries.get(path, (None, None))
+        if stamp == stamp_cache:
+            fonts.append(mfonts.FontEntry(**dict(zip(fields, props))))
+            continue
+        manager.addfont(path)
+        parsed = True
+        entries[path] = (stamp, [getattr(fonts[-1], field) for field in fields])
+    if hasattr(manager, '_findfont_cached'):
+        manager._findfont_cached.cache_clear()
+    if parsed:
+        entries = {path: item for path, item in entries.items() if os.path.isfile(path)}
+        cache._save_cache(path_cache, key, manifest=np.array(json.dumps(entries)))
+    return parsed
+
+
 def _filter_style_dict(rcdict, warn=True):
     """
     Filter out blacklisted style parameters.
@@ -462,15 +601,14 @@ def register_cmaps(*args, user=None, local=None, default=False):
             paths.append(arg)
 
     # Register data files
-    for i, path in _iter_data_objects(
-        'cmaps', *paths, user=user, local=local, default=default
+    for i, data in _load_cmap_data(
+        'cmaps', pcolors.ContinuousColormap,
+        *paths, user=user, local=local, default=default
     ):
-        cmap = pcolors.ContinuousColormap.from_file(path, warn_on_failure=True)
-        if not cmap:
-            continue
+        cmap = pcolors._LazyColormap(pcolors.ContinuousColormap, data)
         if i == 0 and cmap.name.lower() in pcolors.CMAPS_CYCLIC:
             cmap.set_cyclic(True)
-        pcolors._cmap_database[cmap.name] = cmap
+        pcolors._cmap_database[cmap.name] = cmap  # built on first retrieval
 
 
 @docstring._snippet_manager
@@ -505,13 +643,12 @@ def register_cycles(*args, user=None, local=None, default=False):
             paths.append(arg)
 
     # Register data files
-    for _, path in _iter_data_objects(
-        'cycles', *paths, user=user, local=local, default=default
+    for _, data in _load_cmap_data(
+        'cycles', pcolors.DiscreteColormap,
+        *paths, user=user, local=local, default=default
     ):
-        cmap = pcolors.DiscreteColormap.from_file(path, warn_on_failure=True)
-        if not cmap:
-            continue
-        pcolors._cmap_database[cmap.name] = cmap
+        cmap = pcolors._LazyColormap(pcolors.DiscreteColormap, data)
+        pcolors._cmap_database[cmap.name] = cmap  # built on first retrieval
 
 
 @docstring._snippet_manager
@@ -579,19 +716,19 @@ def register_colors(
 
     # Load colors from file and get their HCL values
     # NOTE: Colors that come *later* overwrite colors that come earlier.
+    # NOTE: The filtered XKCD colors are cached to skip the colorspace conversions.
     for i, path in _iter_data_objects(
         'colors', *paths, user=user, local=local, default=default
     ):
-        loaded = pcolors._load_colors(path, warn_on_failure=True)
+        cat, _ = os.path.splitext(os.path.basename(path))
+        if i == 0 and cat == 'xkcd':
+            loaded = _load_distinct_colors(path, space, margin)
+        else:
+            loaded = pcolors._load_colors(path, warn_on_failure=True)
         if i == 0:
-            cat, _ = os.path.splitext(os.path.basename(path))
             if cat not in srcs:
                 raise RuntimeError(f'Unknown proplot color database {path!r}.')
             src = srcs[cat]
-            if cat == 'xkcd':
-                for key in COLORS_KEEP:
-                    loaded[key] = pcolors._color_database[key]  # keep the same
-                loaded = pcolors._standardize_colors(loaded, space, margin)
             src.clear()
             src.update(loaded)  # needed for demos.show_colors()
         pcolors._color_database.update(loaded)
@@ -648,13 +785,13 @@ def register_fonts(*args, user=True, local=True, default=False):
         )
 
     # Rebuild font cache only if necessary! Can be >50% of total import time!
+    # NOTE: Font properties are read from the proplot font cache when possible so
+    # that fonts missing from the matplotlib cache (e.g. after updating matplotlib
+    # or when using a temporary config directory) are added without parsing.
     fnames_all = {font.fname for font in mfonts.fontManager.ttflist}
     fnames_proplot -= fnames_proplot_ttc
-    if not fnames_all >= fnames_proplot:
-        warnings._warn_proplot(
-            'Rebuilding font cache. This usually happens '
-            'after installing or updating proplot.'
-        )
+    fnames_new = sorted(fnames_proplot - fnames_all)
+    if fnames_new:
         if hasattr(mfonts.fontManager, 'addfont'):
             # Newer API lets us add font files manually and deprecates TTFPATH. However
             # to cache fonts added this way, we must call json_dump explicitly.
@@ -662,14 +799,21 @@ def register_fonts(*args, user=True, local=True, default=False):
             # recently became inaccessible. Must reproduce mpl code instead.
             # NOTE: Older mpl versions used fontList.json as the cache, but these
             # versions also did not have 'addfont', so makes no difference.
-            for fname in fnames_proplot:
-                mfonts.fontManager.addfont(fname)
-            cache = os.path.join(
-                mpl.get_cachedir(),
-                f'fontlist-v{mfonts.FontManager.__version__}.json'
-            )
-            mfonts.json_dump(mfonts.fontManager, cache)
+            if _load_font_entries(fnames_new):
+                warnings._warn_proplot(
+                    'Rebuilding font cache. This usually happens '
+                    'after installing or updating proplot.'
+                )
+                path_cache = os.path.join(
+                    mpl.get_cachedir(),
+                    f'fontlist-v{mfonts.FontManager.__version__}.json'
+                )
+                mfonts.json_dump(mfonts.fontManager, path_cache)
         else:
+            warnings._warn_proplot(
+                'Rebuilding font cache. This usually happens '
+                'after installing or updating proplot.'
+            )
             # Older API requires us to modify TTFPATH
             # NOTE: Previously we tried to modify TTFPATH before importing
             # font manager with hope that it would load proplot fonts on
@@ -734,6 +878,8 @@ class Configurator(MutableMapping, dict):
         %(rc.params)s
         """
         self._context = []
+        self._context_view = None
+        self._category_index = None
         self._init(local=local, user=user, default=default, **kwargs)
 
     def __getitem__(self, key):
@@ -786,6 +932,7 @@ class Configurator(MutableMapping, dict):
                 'rc object must be initialized for context block using rc.context().'
             )
         context = self._context[-1]
+        self._context_view = None
         kwargs = context.kwargs
         rc_new = context.rc_new  # used for context-based _get_item_context
         rc_old = context.rc_old  # used to re-apply settings without copying whole dict
@@ -813,6 +960,28 @@ class Configurator(MutableMapping, dict):
             rc_proplot.update(kw_proplot)
             rc_matplotlib.update(kw_matplotlib)
         del self._context[-1]
+        self._context_view = None
+
+    def _get_state(self):
+        """
+        Return copies of the `rc_proplot` and `rc_matplotlib` settings. Used to
+        propagate the current settings to worker processes.
+        """
+        # NOTE: Backend is omitted so that workers can use their own backend.
+        kw_proplot = dict(dict.items(rc_proplot))
+        kw_matplotlib = dict(dict.items(rc_matplotlib))
+        kw_matplotlib.pop('backend', None)
+        return kw_proplot, kw_matplotlib
+
+    def _set_state(self, state):
+        """
+        Apply settings returned by `~Configurator._get_state`. The settings were
+        validated on assignment, so they are copied without validation.
+        """
+        kw_proplot, kw_matplotlib = state
+        dict.update(rc_proplot, kw_proplot)
+        dict.update(rc_matplotlib, kw_matplotlib)
+        self._context_view = None
 
     def _init(self, *, local, user, default, skip_cycle=False):
         """
@@ -820,6 +989,7 @@ class Configurator(MutableMapping, dict):
         """
         # Always remove context objects
         self._context.clear()
+        self._context_view = None
 
         # Update from default settings
         # NOTE: see _remove_blacklisted_style_params bugfix
@@ -891,28 +1061,58 @@ class Configurator(MutableMapping, dict):
         As with `~Configurator.__getitem__` but the search is limited based
         on the context mode and ``None`` is returned if the key is not found.
         """
-        key, _ = self._validate_key(key)
+        # NOTE: This is called many times when formatting and drawing axes. Skip
+        # validation for existing setting names and search the flattened context
+        # dictionary rather than searching each context block in turn.
+        if not isinstance(key, str) or (
+            not dict.__contains__(rc_proplot, key)
+            and not dict.__contains__(rc_matplotlib, key)
+        ):
+            key, _ = self._validate_key(key)
+        mode_context, rc_context = self._get_context_view()
         if mode is None:
-            mode = self._context_mode
-        cache = tuple(context.rc_new for context in self._context)
-        if mode == 0:
-            rcdicts = (*cache, rc_proplot, rc_matplotlib)
-        elif mode == 1:
-            rcdicts = (*cache, rc_proplot)  # added settings only!
-        elif mode == 2:
-            rcdicts = (*cache,)
-        else:
+            mode = mode_context
+        if mode not in range(3):
             raise ValueError(f'Invalid caching mode {mode!r}.')
-        for rcdict in rcdicts:
-            if not rcdict:
-                continue
-            try:
-                return rcdict[key]
-            except KeyError:
-                continue
+        if key in rc_context:
+            return rc_context[key]
+        if mode < 2 and dict.__contains__(rc_proplot, key):  # added settings only!
+            return dict.__getitem__(rc_proplot, key)
+        if mode < 1 and dict.__contains__(rc_matplotlib, key):
+            return rc_matplotlib[key]
         if mode == 0:  # otherwise return None
             raise KeyError(f'Invalid rc setting {key!r}.')
 
+    def _get_context_view(self):
+        """
+        Return the highest context mode and a flattened dictionary of the
+        context settings. This is rebuilt only after entering or exiting a block.
+        """
+        view = self._context_view
+        if view is None:
+            rc_context = {}
+            for context in self._context[::-1]:  # outer blocks take precedence
+                rc_context.update(context.rc_new)
+            mode = max((context.mode for context in self._context), default=0)
+            view = self._context_view = (mode, rc_context)
+        return view
+
+    def _get_category_keys(self, cat):
+        """
+        Return the setting names directly under the category and the names with
+        the category trimmed. The index is rebuilt if settings were added.
+        """
+        size = dict.__len__(rc_proplot) + dict.__len__(rc_matplotlib)
+        index = self._category_index
+        if index is None or index[0] != size:
+            keys = {cat: [] for cat in rcsetup._rc_categories}
+            for key in self:
+                parent, _, name = key.rpartition('.')
+                if parent in keys:
+                    keys[parent].append((key, name))
+            index = self._category_index = (size, keys)
+        return index[1][cat]
+
     def _get_item_dicts(self, key, value, skip_cycle=False):
         """
         Return dictionaries for updating the `rc_proplot` and `rc_matplotlib`
@@ -1428,6 +1628,7 @@ class Configurator(MutableMapping, dict):
         cls = namedtuple('RcContext', ('mode', 'kwargs', 'rc_new', 'rc_old'))
         context = cls(mode=mode, kwargs=kwargs, rc_new={}, rc_old={})
         self._context.append(context)
+        self._context_view = None
         return self
 
     def category(self, cat, *, trimcat=True, context=False):
@@ -1457,15 +1658,11 @@ class Configurator(MutableMapping, dict):
                 + ', '.join(map(repr, rcsetup._rc_categories))
                 + '.'
             )
-        for key in self:
-            if not re.match(fr'\A{cat}\.[^.]+\Z', key):
-                continue
+        for key, name in self._get_category_keys(cat):
             value = self._get_item_context(key, None if context else 0)
             if value is None:
                 continue
-            if trimcat:
-                key = re.sub(fr'\A{cat}\.', '', key)
-            kw[key] = value
+            kw[name if trimcat else key] = value
         return kw
 
     def fill(self, props, *, context=False):
@@ -1718,7 +1915,7 @@ class Configurator(MutableMapping, dict):
         """
         Return the highest (least permissive) context mode.
         """
-        return max((context.mode for context in self._context), default=0)
+        return self._get_context_view()[0]
 
     @property
     def changed(self):
@@ -13,7 +13,8 @@ The constructor functions used to build class instances from simple shorthand ar
 import copy
 import os
 import re
-from functools import partial
+from collections import OrderedDict, namedtuple
+from functools import partial, wraps
 from numbers import Number
 
 import cycler
@@ -30,7 +31,15 @@ from . import scale as pscale
 from . import ticker as pticker
 from .config import rc
 from .internals import ic  # noqa: F401
-from .internals import _not_none, _pop_props, _version_cartopy, _version_mpl, warnings
+from .internals import (
+    _not_none,
+    _pop_props,
+    _version_cartopy,
+    _version_mpl,
+    benchmarks,
+    cache,
+    warnings,
+)
 from .utils import get_colors, to_hex, to_rgba
 
 try:
@@ -333,6 +342,113 @@ RESOS_BASEMAP = {
 }
 
 
+def _copy_result(obj):
+    """
+    Return a copy of the cached constructor result that can be safely modified.
+    """
+    # NOTE: Matplotlib's Colormap.__copy__ copies the lookup table. Also copy the
+    # containers that are modified in-place by e.g. ContinuousColormap.set_alpha.
+    if isinstance(obj, mcolors.Colormap):
+        obj = copy.copy(obj)
+        if hasattr(obj, '_segmentdata'):
+            obj._segmentdata = dict(obj._segmentdata)
+        if isinstance(obj, mcolors.ListedColormap):
+            obj.colors = copy.copy(obj.colors)
+    else:
+        obj = copy.deepcopy(obj)
+    return obj
+
+
+def _get_result_key(arg):
+    """
+    Return a hashable version of the constructor argument or ``None`` if the
+    argument cannot be used as a cache key (e.g. a mutable colormap instance).
+    File names include the file modification time and size.
+    """
+    if isinstance(arg, str) and '.' in arg and os.path.isfile(arg):
+        stamp = cache._get_file_stamp(arg)  # detect changes to colormap files
+        return None if stamp is None else (str, arg, *stamp)
+    if arg is None or isinstance(arg, (str, Number)):
+        return (type(arg), arg)
+    if isinstance(arg, np.ndarray) and arg.dtype.kind in 'biuf':
+        return (np.ndarray, arg.dtype.str, arg.shape, arg.tobytes())
+    if isinstance(arg, (list, tuple)):
+        keys = tuple(map(_get_result_key, arg))
+        if any(key is None for key in keys):
+            return None
+        return (type(arg), keys)
+    if isinstance(arg, dict) and all(isinstance(key, str) for key in arg):
+        keys = _get_result_key(sorted(arg.items()))
+        return None if keys is None else (dict, keys)
+    return None
+
+
+def _memoize_results(func):
+    """
+    Cache results of the constructor function for identical arguments. Results
+    are copied when they are retrieved so that callers cannot modify the cached
+    objects. The cache size is controlled by :rcraw:`cmap.cachesize`.
+    """
+    # NOTE: The cache key includes registry counters and settings used when
+    # building colormaps so results are recomputed when these change. This
+    # includes the property cycle colors used to translate e.g. 'C0'. Counters
+    # ignore private names like '_Blues_copy' registered by Colormap() itself
+    # and names re-registered with an identical colormap (e.g. repeated calls
+    # with the same name=...).
+    cache = OrderedDict()
+    stats = {'hits': 0, 'misses': 0}
+    CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'maxsize', 'currsize'))
+
+    def _get_state():
+        colors = rc['axes.prop_cycle'].by_key().get('color', None)
+        return (
+            _get_result_key(colors),
+            rc['image.lut'],
+            rc['image.cmap'],
+            rc['cmap.listedthresh'],
+            pcolors._cmap_database._generation,
+            pcolors._color_database._generation,
+        )
+
+    @wraps(func)
+    def _wrapper(*args, **kwargs):
+        maxsize = rc['cmap.cachesize']
+        key = None
+        if maxsize > 0 and not kwargs.get('save', False):
+            key = _get_result_key((args, kwargs))
+        if key is None:
+            return func(*args, **kwargs)
+        state = _get_state()
+        if state[0] is None:  # unhashable cycle colors
+            return func(*args, **kwargs)
+        if (key, state) in cache:
+            stats['hits'] += 1
+            cache.move_to_end((key, state))
+            obj = _copy_result(cache[key, state])
+            if isinstance(obj, mcolors.Colormap):  # registered when constructed
+                pcolors._cmap_database[obj.name] = obj
+            return obj
+        stats['misses'] += 1
+        obj = func(*args, **kwargs)
+        state = _get_state()  # include names registered by the constructor
+        cache[key, state] = _copy_result(obj)
+        while len(cache) > maxsize:
+            cache.popitem(last=False)
+        return obj
+
+    def cache_info():
+        maxsize = rc['cmap.cachesize']
+        return CacheInfo(stats['hits'], stats['misses'], maxsize, len(cache))
+
+    def cache_clear():
+        cache.clear()
+        stats.update(hits=0, misses=0)
+
+    _wrapper.cache_info = cache_info
+    _wrapper.cache_clear = cache_clear
+    return _wrapper
+
+
 def _modify_colormap(cmap, *, cut, left, right, reverse, shift, alpha, samples):
     """
     Modify colormap using a variety of methods.
@@ -360,9 +476,11 @@ def _modify_colormap(cmap, *, cut, left, right, reverse, shift, alpha, samples):
     return cmap
 
 
+@benchmarks._benchmark_func('Colormap')
 @warnings._rename_kwargs(
     '0.8.0', fade='saturation', shade='luminance', to_listed='discrete'
 )
+@_memoize_results
 def Colormap(
     *args, name=None, listmode='perceptual', filemode='continuous', discrete=False,
     cycle=None, save=False, save_kw=None, **kwargs
@@ -702,6 +820,8 @@ def Colormap(
     return cmap
 
 
+@benchmarks._benchmark_func('Cycle')
+@_memoize_results
 def Cycle(*args, N=None, samples=None, name=None, **kwargs):
     """
     Generate and merge `~cycler.Cycler` instances in a variety of ways.
@@ -11,6 +11,14 @@ Utilities for converting between colorspaces. Includes the following:
 * `hpluv_to_rgb`
 * `rgb_to_hpluv`
 
+Each of these accepts three scalar channel values and returns three scalar
+channel values (as a tuple for `rgb_to_hsl`, `hsl_to_rgb`, and `rgb_to_hcl`
+and as a list otherwise, matching the original implementation). They are
+thin wrappers around vectorized versions with the suffix ``_array`` (e.g.
+`hcl_to_rgb_array`) that accept and return arrays whose last dimension has
+length 3 (e.g. ``(N, 3)`` arrays). The lower-level functions (e.g.
+`CIExyz_to_CIEluv`) also operate on arrays of channel triples.
+
 Note
 ----
 This file is adapted from `seaborn
@@ -25,20 +33,19 @@ and the `HSLuv system <http://www.hsluv.org/implementations/>`__.
 """
 # Imports. See: https://stackoverflow.com/a/2353265/4970632
 # The HLS is actually HCL
-import math
-from colorsys import hls_to_rgb, rgb_to_hls
+import numpy as np
 
 # Coefficients or something
-m = [
+m = np.array([
     [3.2406, -1.5372, -0.4986],
     [-0.9689, 1.8758, 0.0415],
     [0.0557, -0.2040, 1.0570]
-]
-m_inv = [
+])
+m_inv = np.array([
     [0.4124, 0.3576, 0.1805],
     [0.2126, 0.7152, 0.0722],
     [0.0193, 0.1192, 0.9505]
-]
+])
 # Hard-coded D65 illuminant (has to do with expected light intensity and
 # white balance that falls upon the generated color)
 # See: https://en.wikipedia.org/wiki/Illuminant_D65
@@ -51,9 +58,43 @@ refV = 0.46834
 lab_e = 0.008856
 lab_k = 903.3
 
+# Matrix rows and limits for each of the six lines bounding the RGB gamut
+# in LCh space. Used to vectorize the 'max_chroma' and 'hrad_extremum' loops.
+_m1, _m2, _m3 = np.repeat(m, 2, axis=0).T
+_limits = np.tile([0.0, 1.0], 3)
+
+
+def _triples(triple):
+    """
+    Convert the input to a float array of channel triples.
+    """
+    triple = np.asarray(triple, dtype=float)
+    if triple.shape[-1:] != (3,):
+        raise ValueError(f'Invalid channel array with shape {triple.shape}.')
+    return triple
+
+
+def _channels(triple):
+    """
+    Return the three channels from an array of channel triples.
+    """
+    triple = _triples(triple)
+    return triple[..., 0], triple[..., 1], triple[..., 2]
+
+
+def _stack(*channels):
+    """
+    Stack channel arrays into an array of channel triples.
+    """
+    # NOTE: This is much faster than np.stack() for scalar channels
+    triple = np.empty(np.broadcast(*channels).shape + (3,))
+    for i, channel in enumerate(channels):
+        triple[..., i] = channel
+    return triple
+
 
 def hsluv_to_rgb(h, s, l):
-    return lchuv_to_rgb(*hsluv_to_lchuv([h, s, l]))
+    return hsluv_to_rgb_array([h, s, l]).tolist()
 
 
 def hsluv_to_hex(h, s, l):
@@ -61,7 +102,7 @@ def hsluv_to_hex(h, s, l):
 
 
 def rgb_to_hsluv(r, g, b):
-    return lchuv_to_hsluv(rgb_to_lchuv(r, g, b))
+    return rgb_to_hsluv_array([r, g, b]).tolist()
 
 
 def hex_to_hsluv(color):
@@ -69,7 +110,7 @@ def hex_to_hsluv(color):
 
 
 def hpluv_to_rgb(h, s, l):
-    return lchuv_to_rgb(*hpluv_to_lchuv([h, s, l]))
+    return hpluv_to_rgb_array([h, s, l]).tolist()
 
 
 def hpluv_to_hex(h, s, l):
@@ -77,7 +118,7 @@ def hpluv_to_hex(h, s, l):
 
 
 def rgb_to_hpluv(r, g, b):
-    return lchuv_to_hpluv(rgb_to_lchuv(r, g, b))
+    return rgb_to_hpluv_array([r, g, b]).tolist()
 
 
 def hex_to_hpluv(color):
@@ -85,35 +126,110 @@ def hex_to_hpluv(color):
 
 
 def lchuv_to_rgb(l, c, h):
-    return CIExyz_to_rgb(CIEluv_to_CIExyz(lchuv_to_CIEluv([l, c, h])))
+    return lchuv_to_rgb_array([l, c, h]).tolist()
 
 
 def rgb_to_lchuv(r, g, b):
-    return CIEluv_to_lchuv(CIExyz_to_CIEluv(rgb_to_CIExyz([r, g, b])))
+    return rgb_to_lchuv_array([r, g, b]).tolist()
 
 
 def hsl_to_rgb(h, s, l):
-    h /= 360.0
-    s /= 100.0
-    l /= 100.0  # noqa
-    return hls_to_rgb(h, l, s)
+    return tuple(hsl_to_rgb_array([h, s, l]).tolist())
 
 
 def rgb_to_hsl(r, g, b):
-    h, l, s = rgb_to_hls(r, g, b)
-    h *= 360.0
-    s *= 100.0
-    l *= 100.0  # noqa
-    return h, s, l
+    return tuple(rgb_to_hsl_array([r, g, b]).tolist())
 
 
 def hcl_to_rgb(h, c, l):
-    return CIExyz_to_rgb(CIEluv_to_CIExyz(lchuv_to_CIEluv([l, c, h])))
+    return hcl_to_rgb_array([h, c, l]).tolist()
 
 
 def rgb_to_hcl(r, g, b):
-    l, c, h = CIEluv_to_lchuv(CIExyz_to_CIEluv(rgb_to_CIExyz([r, g, b])))
-    return h, c, l
+    return tuple(rgb_to_hcl_array([r, g, b]).tolist())
+
+
+def hsluv_to_rgb_array(hsl):
+    return lchuv_to_rgb_array(hsluv_to_lchuv(hsl))
+
+
+def rgb_to_hsluv_array(rgb):
+    return lchuv_to_hsluv(rgb_to_lchuv_array(rgb))
+
+
+def hpluv_to_rgb_array(hsl):
+    return lchuv_to_rgb_array(hpluv_to_lchuv(hsl))
+
+
+def rgb_to_hpluv_array(rgb):
+    return lchuv_to_hpluv(rgb_to_lchuv_array(rgb))
+
+
+def lchuv_to_rgb_array(lch):
+    return CIExyz_to_rgb(CIEluv_to_CIExyz(lchuv_to_CIEluv(lch)))
+
+
+def rgb_to_lchuv_array(rgb):
+    return CIEluv_to_lchuv(CIExyz_to_CIEluv(rgb_to_CIExyz(rgb)))
+
+
+def hcl_to_rgb_array(hcl):
+    h, c, l = _channels(hcl)
+    return lchuv_to_rgb_array(_stack(l, c, h))
+
+
+def rgb_to_hcl_array(rgb):
+    l, c, h = _channels(rgb_to_lchuv_array(rgb))
+    return _stack(h, c, l)
+
+
+def hsl_to_rgb_array(hsl):
+    # Vectorized version of colorsys.hls_to_rgb
+    h, s, l = _channels(hsl)
+    h = h / 360.0
+    s = s / 100.0
+    l = l / 100.0  # noqa
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+    m1 = 2.0 * l - m2
+    rgb = _stack(
+        _hls_value(m1, m2, h + 1.0 / 3.0),
+        _hls_value(m1, m2, h),
+        _hls_value(m1, m2, h - 1.0 / 3.0),
+    )
+    gray = _stack(l, l, l)
+    return np.where((s == 0.0)[..., None], gray, rgb)
+
+
+def _hls_value(m1, m2, hue):
+    hue = hue % 1.0
+    return np.select(
+        (hue < 1.0 / 6.0, hue < 0.5, hue < 2.0 / 3.0),
+        (m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0),
+        m1,
+    )
+
+
+def rgb_to_hsl_array(rgb):
+    # Vectorized version of colorsys.rgb_to_hls
+    r, g, b = _channels(rgb)
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0  # noqa
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+    h = np.where(
+        r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc)
+    )
+    h = (h / 6.0) % 1.0
+    gray = minc == maxc
+    h = np.where(gray, 0.0, h)
+    s = np.where(gray, 0.0, s)
+    return _stack(h * 360.0, s * 100.0, l * 100.0)
 
 
 def rgb_prepare(triple):
@@ -146,149 +262,132 @@ def hex_to_rgb(color):
 
 
 def max_chroma(L, H):
-    hrad = math.radians(H)
-    sinH = (math.sin(hrad))
-    cosH = (math.cos(hrad))
-    sub1 = (math.pow(L + 16, 3.0) / 1560896.0)
-    sub2 = sub1 if sub1 > 0.008856 else (L / 903.3)
-    result = float('inf')
-    for row in m:
-        m1 = row[0]
-        m2 = row[1]
-        m3 = row[2]
-        top = ((0.99915 * m1 + 1.05122 * m2 + 1.14460 * m3) * sub2)
-        rbottom = (0.86330 * m3 - 0.17266 * m2)
-        lbottom = (0.12949 * m3 - 0.38848 * m1)
-        bottom = (rbottom * sinH + lbottom * cosH) * sub2
-        for t in (0.0, 1.0):
-            C = (L * (top - 1.05122 * t) / (bottom + 0.17266 * sinH * t))
-            if C > 0.0 and C < result:
-                result = C
-    return result
+    # NOTE: Trailing dimension holds the six gamut boundary lines
+    L = np.asarray(L, dtype=float)[..., None]
+    hrad = np.radians(H)[..., None]
+    sinH = np.sin(hrad)
+    cosH = np.cos(hrad)
+    sub1 = (L + 16) ** 3.0 / 1560896.0
+    sub2 = np.where(sub1 > 0.008856, sub1, L / 903.3)
+    top = (0.99915 * _m1 + 1.05122 * _m2 + 1.14460 * _m3) * sub2
+    rbottom = (0.86330 * _m3 - 0.17266 * _m2)
+    lbottom = (0.12949 * _m3 - 0.38848 * _m1)
+    bottom = (rbottom * sinH + lbottom * cosH) * sub2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        C = L * (top - 1.05122 * _limits) / (bottom + 0.17266 * sinH * _limits)
+    C = np.where(C > 0.0, C, np.inf)
+    return C.min(axis=-1)
+
+
+def _hrad_candidates(L):
+    # Return candidate hue angles and their chroma limits for each boundary line
+    L = np.asarray(L, dtype=float)[..., None]
+    lhs = (L ** 3.0 + 48.0 * L ** 2.0 + 768.0 * L + 4096.0) / 1560896.0
+    rhs = 1107.0 / 125000.0
+    sub = np.where(lhs > rhs, lhs, 10.0 * L / 9033.0)
+    top = -3015466475.0 * _m3 * sub + 603093295.0 * _m2 * sub \
+        - 603093295.0 * _limits
+    bottom = 1356959916.0 * _m1 * sub - 452319972.0 * _m3 * sub
+    hrad = np.arctan2(top, bottom)
+    hrad = np.where(_limits == 0.0, hrad + np.pi, hrad)
+    return hrad, max_chroma(L, np.degrees(hrad))
 
 
 def hrad_extremum(L):
-    lhs = (math.pow(L, 3.0) + 48.0 * math.pow(L, 2.0)
-           + 768.0 * L + 4096.0) / 1560896.0
-    rhs = 1107.0 / 125000.0
-    sub = lhs if lhs > rhs else 10.0 * L / 9033.0
-    chroma = float('inf')
-    result = None
-    for row in m:
-        for limit in (0.0, 1.0):
-            [m1, m2, m3] = row
-            top = -3015466475.0 * m3 * sub + 603093295.0 * m2 * sub \
-                - 603093295.0 * limit
-            bottom = 1356959916.0 * m1 * sub - 452319972.0 * m3 * sub
-            hrad = math.atan2(top, bottom)
-            if limit == 0.0:
-                hrad += math.pi
-            test = max_chroma(L, math.degrees(hrad))
-            if test < chroma:
-                chroma = test
-                result = hrad
-    return result
+    hrad, chroma = _hrad_candidates(L)
+    idx = np.argmin(chroma, axis=-1)[..., None]
+    return np.take_along_axis(hrad, idx, axis=-1)[..., 0]
 
 
 def max_chroma_pastel(L):
-    H = math.degrees(hrad_extremum(L))
-    return max_chroma(L, H)
+    _, chroma = _hrad_candidates(L)
+    return chroma.min(axis=-1)
 
 
 def hsluv_to_lchuv(triple):
-    H, S, L = triple
-    if L > 99.9999999:
-        return [100, 0.0, H]
-    if L < 0.00000001:
-        return [0.0, 0.0, H]
-    mx = max_chroma(L, H)
-    C = mx * S / 100.0
+    H, S, L = _channels(triple)
+    with np.errstate(invalid='ignore'):
+        C = max_chroma(L, H) * S / 100.0
     # if C > 100.0:
     #     raise ValueError(f'HSL color {triple} is outside LCH colorspace.')
-    return [L, C, H]
+    return _lchuv_bounds(L, C, H)
 
 
 def lchuv_to_hsluv(triple):
-    L, C, H = triple
-    if L > 99.9999999:
-        return [H, 0.0, 100.0]
-    if L < 0.00000001:
-        return [H, 0.0, 0.0]
-    mx = max_chroma(L, H)
-    S = 100.0 * C / mx
-    return [H, S, L]
+    L, C, H = _channels(triple)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        S = 100.0 * C / max_chroma(L, H)
+    return _hsluv_bounds(H, S, L)
 
 
 def hpluv_to_lchuv(triple):
-    H, S, L = triple
-    if L > 99.9999999:
-        return [100, 0.0, H]
-    if L < 0.00000001:
-        return [0.0, 0.0, H]
-    mx = max_chroma_pastel(L)
-    C = mx * S / 100.0
+    H, S, L = _channels(triple)
+    with np.errstate(invalid='ignore'):
+        C = max_chroma_pastel(L) * S / 100.0
     # if C > 100.0:
     #     raise ValueError(f'HPL color {triple} is outside LCH colorspace.')
-    return [L, C, H]
+    return _lchuv_bounds(L, C, H)
 
 
 def lchuv_to_hpluv(triple):
-    L, C, H = triple
-    if L > 99.9999999:
-        return [H, 0.0, 100.0]
-    if L < 0.00000001:
-        return [H, 0.0, 0.0]
-    mx = max_chroma_pastel(L)
-    S = 100.0 * C / mx
-    return [H, S, L]
+    L, C, H = _channels(triple)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        S = 100.0 * C / max_chroma_pastel(L)
+    return _hsluv_bounds(H, S, L)
 
 
-def dot_product(a, b):
-    return sum(i * j for i, j in zip(a, b))
-    # return sum(map(operator.mul, a, b))
+def _lchuv_bounds(L, C, H):
+    # Pure white and pure black have zero chroma
+    white, black = L > 99.9999999, L < 0.00000001
+    L = np.where(white, 100.0, np.where(black, 0.0, L))
+    C = np.where(white | black, 0.0, C)
+    return _stack(L, C, H)
+
+
+def _hsluv_bounds(H, S, L):
+    # Pure white and pure black have zero saturation
+    white, black = L > 99.9999999, L < 0.00000001
+    L = np.where(white, 100.0, np.where(black, 0.0, L))
+    S = np.where(white | black, 0.0, S)
+    return _stack(H, S, L)
 
 
 def from_linear(c):
-    if c <= 0.0031308:
-        return 12.92 * c
-    else:
-        return (1.055 * math.pow(c, 1.0 / 2.4) - 0.055)
+    # NOTE: Clip before exponentiating to prevent invalid value warnings
+    c = np.asarray(c, dtype=float)
+    p = np.maximum(c, 0.0) ** (1.0 / 2.4)
+    return np.where(c <= 0.0031308, 12.92 * c, 1.055 * p - 0.055)
 
 
 def to_linear(c):
     a = 0.055
-    if c > 0.04045:
-        return (math.pow((c + a) / (1.0 + a), 2.4))
-    else:
-        return (c / 12.92)
+    c = np.asarray(c, dtype=float)
+    p = np.maximum((c + a) / (1.0 + a), 0.0) ** 2.4
+    return np.where(c > 0.04045, p, c / 12.92)
 
 
 def CIExyz_to_rgb(triple):
-    CIExyz = map(lambda row: dot_product(row, triple), m)
-    return list(map(from_linear, CIExyz))
+    return from_linear(_triples(triple) @ m.T)
 
 
 def rgb_to_CIExyz(triple):
-    rgbl = list(map(to_linear, triple))
-    return list(map(lambda row: dot_product(row, rgbl), m_inv))
+    return to_linear(_triples(triple)) @ m_inv.T
 
 
 def CIEluv_to_lchuv(triple):
-    L, U, V = triple
-    C = (math.pow(math.pow(U, 2) + math.pow(V, 2), (1.0 / 2.0)))
-    hrad = (math.atan2(V, U))
-    H = math.degrees(hrad)
-    if H < 0.0:
-        H = 360.0 + H
-    return [L, C, H]
+    L, U, V = _channels(triple)
+    C = np.sqrt(U ** 2 + V ** 2)
+    H = np.degrees(np.arctan2(V, U))
+    H = np.where(H < 0.0, 360.0 + H, H)
+    return _stack(L, C, H)
 
 
 def lchuv_to_CIEluv(triple):
-    L, C, H = triple
-    Hrad = math.radians(H)
-    U = (math.cos(Hrad) * C)
-    V = (math.sin(Hrad) * C)
-    return [L, U, V]
+    L, C, H = _channels(triple)
+    Hrad = np.radians(H)
+    U = np.cos(Hrad) * C
+    V = np.sin(Hrad) * C
+    return _stack(L, U, V)
 
 
 # Try setting gamma from: https://en.wikipedia.org/wiki/HCL_color_space
@@ -297,42 +396,36 @@ gamma = 3.0  # tunable? nah, get weird stuff
 
 
 def CIEfunc(t):
-    if t > lab_e:
-        return (math.pow(t, 1.0 / gamma))
-    else:
-        return (7.787 * t + 16.0 / 116.0)
+    t = np.asarray(t, dtype=float)
+    p = np.maximum(t, 0.0) ** (1.0 / gamma)
+    return np.where(t > lab_e, p, 7.787 * t + 16.0 / 116.0)
 
 
 def CIEfunc_inverse(t):
-    if math.pow(t, 3.0) > lab_e:
-        return (math.pow(t, gamma))
-    else:
-        return (116.0 * t - 16.0) / lab_k
+    t = np.asarray(t, dtype=float)
+    return np.where(t ** 3.0 > lab_e, t ** gamma, (116.0 * t - 16.0) / lab_k)
 
 
 def CIExyz_to_CIEluv(triple):
-    X, Y, Z = triple
-    if X == Y == Z == 0.0:
-        return [0.0, 0.0, 0.0]
-    varU = (4.0 * X) / (X + (15.0 * Y) + (3.0 * Z))
-    varV = (9.0 * Y) / (X + (15.0 * Y) + (3.0 * Z))
+    X, Y, Z = _channels(triple)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        varU = (4.0 * X) / (X + (15.0 * Y) + (3.0 * Z))
+        varV = (9.0 * Y) / (X + (15.0 * Y) + (3.0 * Z))
     L = 116.0 * CIEfunc(Y / refY) - 16.0
-    # Black will create a divide-by-zero error
-    if L == 0.0:
-        return [0.0, 0.0, 0.0]
     U = 13.0 * L * (varU - refU)
     V = 13.0 * L * (varV - refV)
-    return [L, U, V]
+    # Black will create a divide-by-zero error
+    black = ((X == 0.0) & (Y == 0.0) & (Z == 0.0)) | (L == 0.0)
+    return np.where(black[..., None], 0.0, _stack(L, U, V))
 
 
 def CIEluv_to_CIExyz(triple):
-    L, U, V = triple
-    if L == 0:
-        return [0.0, 0.0, 0.0]
+    L, U, V = _channels(triple)
     varY = CIEfunc_inverse((L + 16.0) / 116.0)
-    varU = U / (13.0 * L) + refU
-    varV = V / (13.0 * L) + refV
-    Y = varY * refY
-    X = 0.0 - (9.0 * Y * varU) / ((varU - 4.0) * varV - varU * varV)
-    Z = (9.0 * Y - (15.0 * varV * Y) - (varV * X)) / (3.0 * varV)
-    return [X, Y, Z]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        varU = U / (13.0 * L) + refU
+        varV = V / (13.0 * L) + refV
+        Y = varY * refY
+        X = 0.0 - (9.0 * Y * varU) / ((varU - 4.0) * varV - varU * varV)
+        Z = (9.0 * Y - (15.0 * varV * Y) - (varV * X)) / (3.0 * varV)
+    return np.where((L == 0)[..., None], 0.0, _stack(X, Y, Z))
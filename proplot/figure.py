@@ -25,6 +25,7 @@ from .internals import (
     _pop_params,
     _pop_rc,
     _translate_loc,
+    benchmarks,
     context,
     docstring,
     labels,
@@ -388,8 +389,15 @@ Save the figure.
 
 Parameters
 ----------
-path : path-like, optional
-    The file path. User paths are expanded with `os.path.expanduser`.
+filename : path-like, file-like, or list thereof
+    The file path(s). User paths are expanded with `os.path.expanduser`. If
+    a list is passed, the figure layout is computed once and reused for
+    every file, e.g. ``fig.save(['fig.png', 'fig.pdf', 'fig.svg'])``.
+formats : str or list of str, optional
+    The file format(s). If `filename` is a single path, the figure is saved
+    once per format with the file extension replaced or appended, e.g.
+    ``fig.save('fig', formats=('png', 'pdf'))`` or ``fig.save('fig', formats='png')``.
+    Otherwise this must match the length of `filename`.
 **kwargs
     Passed to `~matplotlib.figure.Figure.savefig`
 
@@ -459,9 +467,15 @@ def _add_canvas_preprocessor(canvas, method, cache=False):
         ctx1 = fig._context_adjusting(cache=cache)
         ctx2 = fig._context_authorized()  # skip backend set_constrained_layout()
         ctx3 = rc.context(fig._render_context)  # draw with figure-specific setting
+        # NOTE: Layout fingerprint is recorded after drawing because drawing
+        # updates the positions of axis labels and titles.
         with ctx1, ctx2, ctx3:
+            if fig._is_exporting:
+                return func(self, *args, **kwargs)
             fig.auto_layout()
-            return func(self, *args, **kwargs)
+            result = func(self, *args, **kwargs)
+            fig._layout_key = fig._get_layout_key()
+            return result
 
     # Add preprocessor
     setattr(canvas, method, _canvas_preprocess.__get__(canvas))
@@ -705,6 +719,8 @@ class Figure(mfigure.Figure):
         self._is_authorized = False
         self._includepanels = None
         self._render_context = {}
+        self._layout_key = None  # fingerprint of the last auto layout
+        self._is_exporting = False
         rc_kw, rc_mode = _pop_rc(kwargs)
         kw_format = _pop_params(kwargs, self._format_signature)
         if figwidth is not None and figheight is not None:
@@ -746,6 +762,13 @@ class Figure(mfigure.Figure):
             kw['_cachedRenderer'] = None  # temporarily ignore it
         return context._state_context(self, **kw)
 
+    def _context_exporting(self):
+        """
+        Prevent re-running auto layout steps when saving a figure to multiple files.
+        The layout resolved for the first file is reused for the rest.
+        """
+        return context._state_context(self, _is_exporting=True)
+
     def _context_authorized(self):
         """
         Prevent warning message when internally calling no-op methods. Otherwise
@@ -1415,10 +1438,49 @@ class Figure(mfigure.Figure):
         """
         return self._add_subplots(*args, **kwargs)
 
-    def auto_layout(self, renderer=None, aspect=None, tight=None, resize=None):
+    def _get_layout_key(self, aspect=True, tight=None):
+        """
+        Return a fingerprint of the figure properties that determine the automatic
+        layout. Includes the figure size and resolution, the gridspec parameters,
+        the axes positions, and the subplot contents that determine the tight
+        bounding boxes (see `~proplot.axes.Axes._get_tight_key`).
+        """
+        gs = self.gridspec
+        tight = _not_none(tight, self._tight_active)
+        key = [
+            aspect, tight,
+            tuple(self.get_size_inches()), self.dpi,
+            self._figwidth, self._figheight, self._refwidth, self._refheight,
+            self._refnum, self._refaspect, self._includepanels,
+        ]
+        if gs is not None:
+            key.extend((
+                gs._nrows_total, gs._ncols_total,
+                gs._left, gs._right, gs._bottom, gs._top,
+                tuple(gs._hspace_total), tuple(gs._wspace_total),
+                tuple(gs._hratios_total), tuple(gs._wratios_total),
+                tuple(gs._hpad_total), tuple(gs._wpad_total),
+                gs._outerpad, gs._innerpad, gs._panelpad,
+                gs._hequal, gs._wequal, gs._hgroup, gs._wgroup,
+            ))
+        for artist in self.get_children():
+            if artist is self.patch:
+                continue
+            if isinstance(artist, paxes.Axes):
+                bounds = artist.get_position(original=True).bounds
+                key.append((id(artist), bounds, artist._get_tight_key()))
+            else:
+                key.append(labels._get_artist_key(artist))
+        return key
+
+    @benchmarks._benchmark_func('Figure.auto_layout')
+    def auto_layout(
+        self, renderer=None, aspect=None, tight=None, resize=None, force=False
+    ):
         """
         Automatically adjust the figure size and subplot positions. This is
-        triggered automatically whenever the figure is drawn.
+        triggered automatically whenever the figure is drawn. The layout is
+        skipped if nothing that affects it has changed since the last call.
 
         Parameters
         ----------
@@ -1438,6 +1500,10 @@ class Figure(mfigure.Figure):
             unless both `figwidth` and `figheight` or `figsize` were passed
             to `~Figure.subplots`, `~Figure.set_size_inches` was called manually,
             or the figure was resized manually with an interactive backend.
+        force : bool, optional
+            Whether to recompute the layout even if the figure size, gridspec
+            parameters, axes positions and limits, and text objects are unchanged
+            since the last layout. By default, this is ``False``.
         """
         # *Impossible* to get notebook backend to work with auto resizing so we
         # just do the tight layout adjustments and skip resizing.
@@ -1458,7 +1524,7 @@ class Figure(mfigure.Figure):
         def _draw_content():
             for ax in self._iter_axes(hidden=False, children=True):
                 ax._add_queued_guides()  # may trigger resizes if panels are added
-        def _align_content():  # noqa: E306
+        def _align_content():  # noqa: E301, E306
             for axis in 'xy':
                 self._align_axis_label(axis)
             for side in ('left', 'right', 'top', 'bottom'):
@@ -1468,20 +1534,38 @@ class Figure(mfigure.Figure):
         # Update the layout
         # WARNING: Tried to avoid two figure resizes but made
         # subsequent tight layout really weird. Have to resize twice.
-        _draw_content()
+        # NOTE: Fingerprint is computed after drawing queued guides and recorded
+        # after the layout is finished so that repeated draws or saves of a figure
+        # with only new data (e.g. animations) reuse the existing spaces.
+        with benchmarks._benchmark('guides'):
+            _draw_content()
         if not gs:
             return
-        if aspect:
-            gs._auto_layout_aspect()
-        _align_content()
-        if tight:
-            gs._auto_layout_tight(renderer)
-        _align_content()
+        with benchmarks._benchmark('key'):
+            key = self._get_layout_key(aspect, tight)
+        if not force and key == self._layout_key:
+            return
+        # NOTE: Text extents are memoized across the alignment and tight layout
+        # steps since the same labels are measured repeatedly in each step.
+        with labels._memoize_metrics(renderer):
+            if aspect:
+                with benchmarks._benchmark('aspect'):
+                    gs._auto_layout_aspect()
+            with benchmarks._benchmark('align'):
+                _align_content()
+            if tight:
+                with benchmarks._benchmark('tight'):
+                    gs._auto_layout_tight(renderer)
+            with benchmarks._benchmark('align'):
+                _align_content()
+        with benchmarks._benchmark('key'):
+            self._layout_key = self._get_layout_key(aspect, tight)
 
     @warnings._rename_kwargs(
         '0.10.0', mathtext_fallback='pplt.rc.mathtext_fallback = {}'
     )
     @docstring._snippet_manager
+    @benchmarks._benchmark_func('Figure.format')
     def format(
         self, axs=None, *,
         figtitle=None, suptitle=None, suptitle_kw=None,
@@ -1718,23 +1802,75 @@ class Figure(mfigure.Figure):
         return leg
 
     @docstring._snippet_manager
-    def save(self, filename, **kwargs):
+    def save(self, filename, formats=None, **kwargs):
         """
         %(figure.save)s
         """
-        return self.savefig(filename, **kwargs)
+        return self.savefig(filename, formats=formats, **kwargs)
 
     @docstring._concatenate_inherited
     @docstring._snippet_manager
-    def savefig(self, filename, **kwargs):
+    def savefig(self, filename, formats=None, **kwargs):
         """
         %(figure.save)s
         """
         # Automatically expand the user name. Undocumented because we
         # do not want to overwrite the matplotlib docstring.
-        if isinstance(filename, str):
-            filename = os.path.expanduser(filename)
-        super().savefig(filename, **kwargs)
+        # NOTE: The layout is identical for every output format because auto layout
+        # always measures text with the figure canvas renderer (see _get_renderer).
+        # So we resolve the layout and queued guides once with the first file then
+        # skip the layout and fingerprint steps for the remaining files.
+        items = self._parse_save_paths(filename, formats)
+        if 'format' in kwargs and len(items) > 1:
+            raise ValueError(
+                "Cannot pass 'format' when saving to multiple files. "
+                "Use 'formats' instead."
+            )
+        # NOTE: Vector backends draw with a different resolution, so the layout
+        # fingerprint must be recorded after the final draw. Otherwise subsequent
+        # draws would redo the layout using text positions from the vector backend.
+        for i, (path, fmt) in enumerate(items):
+            if fmt is not None:
+                kwargs['format'] = fmt
+            if i == 0:
+                super().savefig(path, **kwargs)
+                continue
+            with self._context_exporting():
+                super().savefig(path, **kwargs)
+        if len(items) > 1:
+            with rc.context(self._render_context):
+                self._layout_key = self._get_layout_key()
+
+    def _parse_save_paths(self, filename, formats=None):
+        """
+        Return a list of (path, format) pairs from the input file name(s) and
+        format(s). Single paths are expanded to one path per format.
+        """
+        paths = list(filename) if isinstance(filename, (list, tuple)) else [filename]
+        paths = [os.path.expanduser(p) if isinstance(p, str) else p for p in paths]
+        if formats is None:
+            return [(path, None) for path in paths]
+        elif isinstance(formats, str):
+            formats = [formats]
+        else:
+            formats = list(formats)
+        if len(paths) == 1:
+            path, = paths
+            if not isinstance(path, (str, os.PathLike)):
+                if len(formats) == 1:
+                    return [(path, *formats)]
+                raise ValueError('Cannot save multiple formats to one file object.')
+            path = os.fspath(path)
+            root, ext = os.path.splitext(path)
+            supported = self.canvas.get_supported_filetypes()
+            if ext[1:].lower() not in supported:
+                root = path
+            paths = [f'{root}.{fmt}' for fmt in formats]
+        if len(paths) != len(formats):
+            raise ValueError(
+                f'Got {len(paths)} file names but {len(formats)} formats.'
+            )
+        return list(zip(paths, formats))
 
     @docstring._concatenate_inherited
     def set_canvas(self, canvas):
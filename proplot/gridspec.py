@@ -707,54 +707,75 @@ class GridSpec(mgridspec.GridSpec):
             space = self.hspace_total
             pad = self.hpad_total
 
-        # Iterate along each row or column space
+        # Build an index of the axes abutting each row or column edge
+        # NOTE: For each row or column across this direction we record the sorted
+        # unique indices of right/bottom and left/top edges along this direction
+        # and the axes with each edge. Then the nearest abutting axes on either side
+        # of each space are found with a binary search rather than a linear scan.
         axs = tuple(fig._iter_axes(hidden=True, children=False))
         space = list(space)  # a copy
-        ralong = np.array([ax._range_subplotspec(x) for ax in axs])
-        racross = np.array([ax._range_subplotspec(y) for ax in axs])
+        edges = [({}, {}) for _ in range(nacross)]  # (edge1, edge2) dictionaries
+        for idx, ax in enumerate(axs):
+            (a1, a2), (c1, c2) = ax._range_subplotspec(x), ax._range_subplotspec(y)
+            for j in range(c1, c2 + 1):  # e.g. each row
+                edges[j][0].setdefault(a2, []).append(idx)  # r / b edge
+                edges[j][1].setdefault(a1, []).append(idx)  # l / t edge
+        found = []  # (edge1, nearest edge1 keys, edge2, nearest edge2 keys)
+        ii = np.arange(len(space))
+        for edge1, edge2 in edges:
+            # Find the nearest right/bottom edge at or before each space and the
+            # nearest left/top edge at or after the next row or column.
+            # NOTE: Rigorously account for empty and overlapping slots here
+            if sum(map(len, edge1.values())) < 2:
+                continue  # no interface
+            keys1, keys2 = np.sort(list(edge1)), np.sort(list(edge2))
+            pos1 = np.searchsorted(keys1, ii, side='right') - 1
+            pos2 = np.searchsorted(keys2, ii + 1, side='left')
+            keys1 = np.append(keys1, -1)[pos1]  # position -1 indicates missing
+            keys2 = np.append(keys2, -1)[pos2]  # position size indicates missing
+            found.append((edge1, keys1, edge2, keys2))
+
+        # Iterate along each row or column space
+        # NOTE: Tight bounding box spans are retrieved once for each axes.
+        spans = np.array([ax._range_tightbbox(x) for ax in axs]).reshape(-1, 2)
         for i, (s, p) in enumerate(zip(space, pad)):
-            # Find axes that abutt aginst this row or column space
+            # Put axes into unique groups and store as (l, r) or (b, t) pairs.
+            # NOTE: Axes are added to the first group that shares any axes on either
+            # side. Record the first group containing each axes to avoid searching.
             groups = []
-            for j in range(nacross):  # e.g. each row
-                # Get the indices for axes that meet this row or column edge.
-                # NOTE: Rigorously account for empty and overlapping slots here
-                filt = (racross[:, 0] <= j) & (j <= racross[:, 1])
-                if sum(filt) < 2:
-                    continue  # no interface
-                ii = i
-                idx1 = idx2 = np.array(())
-                while ii >= 0 and idx1.size == 0:
-                    filt1 = ralong[:, 1] == ii  # i.e. r / b edge abutts against this
-                    idx1, = np.where(filt & filt1)
-                    ii -= 1
-                ii = i + 1
-                while ii <= len(space) and idx2.size == 0:
-                    filt2 = ralong[:, 0] == ii  # i.e. l / t edge abutts against this
-                    idx2, = np.where(filt & filt2)
-                    ii += 1
-                # Put axes into unique groups and store as (l, r) or (b, t) pairs.
-                axs1, axs2 = [axs[_] for _ in idx1], [axs[_] for _ in idx2]
+            first1, first2 = {}, {}
+            for edge1, found1, edge2, found2 in found:
+                idx1 = edge1[found1[i]] if found1[i] >= 0 else ()
+                idx2 = edge2[found2[i]] if found2[i] >= 0 else ()
                 if x != 'x':  # order bottom-to-top
-                    axs1, axs2 = axs2, axs1
-                for (group1, group2) in groups:
-                    if any(_ in group1 for _ in axs1) or any(_ in group2 for _ in axs2):
-                        group1.update(axs1)
-                        group2.update(axs2)
-                        break
+                    idx1, idx2 = idx2, idx1
+                nums = [first1[_] for _ in idx1 if _ in first1]
+                nums.extend(first2[_] for _ in idx2 if _ in first2)
+                if nums:
+                    num = min(nums)
+                elif idx1 and idx2:
+                    num = len(groups)
+                    groups.append((set(), set()))  # form new group
                 else:
-                    if axs1 and axs2:
-                        groups.append((set(axs1), set(axs2)))  # form new group
+                    continue
+                groups[num][0].update(idx1)
+                groups[num][1].update(idx2)
+                for first, idxs in ((first1, idx1), (first2, idx2)):
+                    for _ in idxs:
+                        first[_] = min(first.get(_, num), num)
             # Determing the spaces using cached tight bounding boxes
             # NOTE: Set gridspec space to zero if there are no adjacent edges
             if not group:
                 groups = [(
-                    set(ax for (group1, _) in groups for ax in group1),
-                    set(ax for (_, group2) in groups for ax in group2),
+                    set(idx for (group1, _) in groups for idx in group1),
+                    set(idx for (_, group2) in groups for idx in group2),
                 )]
             margins = []
             for (group1, group2) in groups:
-                x1 = max(ax._range_tightbbox(x)[1] for ax in group1)
-                x2 = min(ax._range_tightbbox(x)[0] for ax in group2)
+                if not group1 or not group2:
+                    continue
+                x1 = np.fmax.reduce(spans[list(group1), 1])
+                x2 = np.fmin.reduce(spans[list(group2), 0])
                 margins.append((x2 - x1) / self.figure.dpi)
             s = 0 if not margins else max(0, s - min(margins) + p)
             space[i] = s
@@ -46,6 +46,7 @@ def _not_none(*args, default=None, **kwargs):
 # WARNING: Must come after _not_none because this is leveraged inside other funcs
 from . import (  # noqa: F401
     benchmarks,
+    cache,
     context,
     docstring,
     fonts,
@@ -1,25 +1,73 @@
 #!/usr/bin/env python3
 """
-Utilities for benchmarking proplot performance.
+Utilities for profiling proplot performance.
 """
+import functools
+import os
 import time
 
 from . import ic  # noqa: F401
 
-BENCHMARK = False  # toggle this to turn on benchmarking (see timers.py)
+# Toggle this to turn on profiling (see proplot/profile.py). Set the environment
+# variable PROPLOT_PROFILE to record timings while proplot is imported.
+BENCHMARK = bool(os.environ.get('PROPLOT_PROFILE'))
+
+# Timer state. Timings are stored as [count, total, min, max] lists indexed
+# by the '/'-delimited names of the active timers.
+_timer_names = []
+_timer_stats = {}
+_timer_callbacks = []
 
 
 class _benchmark(object):
     """
-    Context object for timing arbitrary blocks of code.
+    Context object for timing arbitrary blocks of code. Timers entered inside
+    other timers are recorded under the parent timer name.
     """
-    def __init__(self, message):
-        self.message = message
+    __slots__ = ('name', 'time')
+
+    def __init__(self, name):
+        self.name = name
+        self.time = None
 
     def __enter__(self):
-        if BENCHMARK:
-            self.time = time.perf_counter()
+        # NOTE: Skip timers with the same name as their parent so that e.g. calls
+        # to super().format() are included in the subclass format() timings.
+        if not BENCHMARK or _timer_names and _timer_names[-1] == self.name:
+            return
+        _timer_names.append(self.name)
+        self.time = time.perf_counter()
 
     def __exit__(self, *args):  # noqa: U100
-        if BENCHMARK:
-            print(f'{self.message}: {time.perf_counter() - self.time}s')
+        if self.time is None:
+            return
+        seconds = time.perf_counter() - self.time
+        path = '/'.join(_timer_names)
+        del _timer_names[-1]
+        self.time = None
+        stats = _timer_stats.get(path)
+        if stats is None:
+            _timer_stats[path] = [1, seconds, seconds, seconds]
+        else:
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = min(stats[2], seconds)
+            stats[3] = max(stats[3], seconds)
+        for callback in _timer_callbacks:
+            callback(path, seconds)
+
+
+def _benchmark_func(name):
+    """
+    Return a decorator that times the function using `_benchmark`. The function
+    is called directly when profiling is disabled.
+    """
+    def _decorator(func):
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            if not BENCHMARK:
+                return func(*args, **kwargs)
+            with _benchmark(name):
+                return func(*args, **kwargs)
+        return _wrapper
+    return _decorator
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Utilities for caching data files parsed on import.
+"""
+import json
+import os
+
+import numpy as np
+
+from . import ic  # noqa: F401
+
+# Increment this whenever the format of cached data changes
+CACHE_VERSION = 1
+
+
+def _get_cache_key(*args):
+    """
+    Return a string key used to validate the cache. Includes the proplot version
+    and cache format version so that updating proplot invalidates old caches.
+    """
+    from .. import __version__
+    return json.dumps([CACHE_VERSION, __version__, *args])
+
+
+def _get_file_stamp(path):
+    """
+    Return the modification time and size of the file. Used to detect changes.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _load_cache(path, key):
+    """
+    Return a dictionary of arrays stored in the cache file. Returns ``None`` if the
+    file is missing, is corrupt, or was saved with a different key.
+    """
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if str(data['_key']) != key:
+                return None
+            return {name: data[name] for name in data.files if name != '_key'}
+    except Exception:  # zipfile, pickling, and io errors
+        return None
+
+
+def _save_cache(path, key, **arrays):
+    """
+    Save the arrays to the cache file. Fails silently if the file cannot be written,
+    e.g. due to a read-only filesystem. Writes to a temporary file then moves it into
+    place so that concurrent processes never read a partially-written cache.
+    """
+    temp = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp, 'wb') as fh:
+            np.savez(fh, _key=np.array(key), **arrays)
+        os.replace(temp, path)
+    except OSError:
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
@@ -3,6 +3,7 @@
 Utilities for processing input data passed to plotting commands.
 """
 import functools
+import itertools
 import sys
 
 import numpy as np
@@ -18,6 +19,10 @@ except ModuleNotFoundError:
 
 
 # Constants
+# NOTE: Lazy arrays are reduced blockwise so the sample size is only used to
+# bound the memory needed for robust percentile estimates.
+LAZY_SAMPLE = 2 ** 22
+DECIMATE_METHODS = ('mean', 'max', 'min', 'nearest')
 BASEMAP_FUNCS = (  # default latlon=True
     'barbs', 'contour', 'contourf', 'hexbin',
     'imshow', 'pcolor', 'pcolormesh', 'plot',
@@ -41,19 +46,32 @@ def _load_objects():
     # try loading these classes within autoformat calls. This saves >500ms of import
     # time. We use ndarray as the default value for unimported types and in loops we
     # are careful to check membership to np.ndarray before anything else.
-    global ndarray, DataArray, DataFrame, Series, Index, Quantity
+    global ndarray, DataArray, DataFrame, Series, Index, Quantity, DaskArray
     ndarray = np.ndarray
     DataArray = getattr(sys.modules.get('xarray', None), 'DataArray', ndarray)
     DataFrame = getattr(sys.modules.get('pandas', None), 'DataFrame', ndarray)
     Series = getattr(sys.modules.get('pandas', None), 'Series', ndarray)
     Index = getattr(sys.modules.get('pandas', None), 'Index', ndarray)
     Quantity = getattr(sys.modules.get('pint', None), 'Quantity', ndarray)
+    DaskArray = getattr(sys.modules.get('dask.array', None), 'Array', ndarray)
 
 
 _load_objects()
 
 
 # Type utilities
+def _is_lazy(data):
+    """
+    Test whether input is a dask array or an array container wrapping a dask array.
+    """
+    _load_objects()
+    if DaskArray is ndarray:
+        return False
+    if isinstance(data, DataArray):
+        data = data.data
+    return isinstance(data, DaskArray)
+
+
 def _is_numeric(data):
     """
     Test whether input is numeric array rather than datetime or strings.
@@ -100,10 +118,8 @@ def _to_duck_array(data, strip_units=False):
     _load_objects()
     if data is None:
         raise ValueError('Invalid data None.')
-    if (
-        not isinstance(data, (ndarray, DataArray, DataFrame, Series, Index, Quantity))
-        or not np.iterable(data)
-    ):
+    types = (ndarray, DataArray, DataFrame, Series, Index, Quantity, DaskArray)
+    if not isinstance(data, types) or not np.iterable(data):
         # WARNING: this strips e.g. scalar DataArray metadata
         data = _to_numpy_array(data)
     if strip_units:  # used for z coordinates that cannot have units
@@ -117,9 +133,10 @@ def _to_duck_array(data, strip_units=False):
     return data
 
 
-def _to_numpy_array(data, strip_units=False):
+def _to_numpy_array(data, strip_units=False, lazy=False):
     """
     Convert arbitrary input to numpy array. Preserve masked arrays and unit arrays.
+    If `lazy` is ``True`` then dask arrays are returned without computing them.
     """
     _load_objects()
     if data is None:
@@ -130,6 +147,10 @@ def _to_numpy_array(data, strip_units=False):
         data = data.data  # support pint quantities that get unit-stripped later
     elif isinstance(data, (DataFrame, Series, Index)):
         data = data.values
+    if DaskArray is not ndarray and isinstance(data, DaskArray):
+        if lazy:
+            return data
+        data = data.compute()  # otherwise np.atleast_1d() returns a dask array
     if Quantity is not ndarray and isinstance(data, Quantity):
         if strip_units:
             return np.atleast_1d(data.magnitude)
@@ -213,6 +234,109 @@ def _to_centers(x, y, z):
     return x, y
 
 
+def _to_decimated(x, y, *zs, steps=(1, 1), method='mean'):
+    """
+    Reduce blocks of data values using the input method and load lazily-loaded
+    arrays into memory. Coordinates can be centers or edges.
+    """
+    # NOTE: Edges are selected at the start of each block plus the final edge.
+    # Centers are averaged unless the method is 'nearest' or they cannot be
+    # averaged (e.g. datetimes or unit quantities), in which case the first
+    # center in each block is selected. This works for curvilinear grids.
+    if method not in DECIMATE_METHODS:
+        raise ValueError(
+            f'Invalid downsample_method {method!r}. Options are: '
+            + ', '.join(map(repr, DECIMATE_METHODS))
+            + '.'
+        )
+    ystep, xstep = steps
+    ny, nx = zs[0].shape[:2]
+    zs = tuple(_to_numpy_array(_reduce_blocks(z, ystep, xstep, method)) for z in zs)
+    mean = method != 'nearest'
+    if x is not None and x.ndim == 2:
+        x = _reduce_coords(x, ystep, ny, axis=0, mean=mean)
+        x = _reduce_coords(x, xstep, nx, axis=1, mean=mean)
+    elif x is not None:
+        x = _reduce_coords(x, xstep, nx, mean=mean)
+    if y is not None and y.ndim == 2:
+        y = _reduce_coords(y, ystep, ny, axis=0, mean=mean)
+        y = _reduce_coords(y, xstep, nx, axis=1, mean=mean)
+    elif y is not None:
+        y = _reduce_coords(y, ystep, ny, mean=mean)
+    return (x, y, *zs)
+
+
+def _reduce_blocks(data, ystep, xstep, method='mean'):
+    """
+    Reduce blocks of cells along the first two dimensions. Supports numpy and dask
+    arrays. Trailing partial blocks are reduced over the available cells and blocks
+    without any valid cells are set to NaN.
+    """
+    # NOTE: Invalid values are replaced with the reduction identity then blocks
+    # without valid values are masked afterward. This avoids the all-NaN warnings
+    # emitted by nanmean and nanmax and works blockwise for dask arrays.
+    if data.ndim < 2 or ystep == xstep == 1:
+        return data
+    dtype = data.dtype
+    if method == 'nearest' or not np.issubdtype(dtype, np.number):
+        return data[::ystep, ::xstep]
+    if isinstance(data, ma.MaskedArray):
+        data = data.astype(np.float64).filled(np.nan)
+    fill, func = {
+        'mean': (0, np.sum),
+        'max': (-np.inf, np.max),
+        'min': (np.inf, np.min),
+    }[method]
+    valid = np.isfinite(data)
+    pad = [(0, -n % step) for n, step in zip(data.shape, (ystep, xstep))]
+    pad.extend((0, 0) for _ in range(data.ndim - 2))
+    values = np.pad(np.where(valid, data, fill), pad, constant_values=fill)
+    values = _reduce_array(values, ystep, xstep, func)
+    counts = _reduce_array(np.pad(valid, pad), ystep, xstep, np.sum)
+    if method == 'mean':
+        values = values / np.maximum(counts, 1)
+    values = np.where(counts > 0, values, np.nan)
+    if data.ndim > 2 and np.issubdtype(dtype, np.integer):  # e.g. RGB images
+        values = np.round(np.nan_to_num(values)).astype(dtype)
+    return values
+
+
+def _reduce_array(data, ystep, xstep, func):
+    """
+    Apply the reduction to blocks of cells along the first two dimensions. The
+    dimension sizes must be divisible by the block sizes.
+    """
+    if _is_lazy(data):
+        import dask.array as da
+        chunks = {
+            axis: step * max(1, round(data.chunks[axis][0] / step))
+            for axis, step in enumerate((ystep, xstep))
+        }
+        data = data.rechunk(chunks)
+        return da.coarsen(func, data, {0: ystep, 1: xstep})
+    ny, nx = data.shape[:2]
+    shape = (ny // ystep, ystep, nx // xstep, xstep, *data.shape[2:])
+    return func(data.reshape(shape), axis=(1, 3))
+
+
+def _reduce_coords(data, step, size, axis=0, mean=True):
+    """
+    Reduce coordinates for blocks of `step` cells along the axis. If the
+    coordinates are edges of `size` cells then the final edge is also returned.
+    """
+    if step == 1:
+        return data
+    idx = np.arange(0, size, step)
+    if data.shape[axis] == size + 1:
+        return np.take(data, np.append(idx, size), axis=axis)
+    if not mean or not _is_float_array(data):
+        return np.take(data, idx, axis=axis)
+    counts = np.diff(np.append(idx, size))
+    shape = [1] * data.ndim
+    shape[axis] = counts.size
+    return np.add.reduceat(data, idx, axis=axis) / counts.reshape(shape)
+
+
 # Input argument processing
 def _from_data(data, *args):
     """
@@ -487,43 +611,192 @@ def _safe_mask(mask, *args):
     return args_masked[0] if len(args_masked) == 1 else args_masked
 
 
-def _safe_range(data, lo=0, hi=100):
+def _safe_range(data, lo=0, hi=100, sample=None):
     """
     Safely return the minimum and maximum (default) or percentile range accounting
     for masked values. Use min and max functions when possible for speed. Return
-    ``None`` if we fail to get a valid range.
+    ``None`` if we fail to get a valid range. If `sample` is passed, percentiles
+    are estimated from a deterministic random sample with at most this many values.
     """
+    # NOTE: Numeric arrays are reduced in chunks so that extrema are found without
+    # copying or masking the entire array. Percentiles need one copy of the valid
+    # values (filled chunk by chunk), and both are computed with one partition.
+    # Other arrays (e.g. datetimes and object arrays) are compressed into a copy
+    # of the valid values.
     _load_objects()
-    data, units = _to_masked_array(data)
-    data = data.compressed()  # remove all invalid values
+    if _is_lazy(data):
+        return _safe_bounds_lazy(_to_numpy_array(data, lazy=True), lo, hi, sample)
+    data, units = _to_masked_array(data) if not _is_float_array(data) else (data, None)
+    if isinstance(data, ma.MaskedArray):
+        data = data.compressed()  # remove all invalid values
+        data = data if data.dtype == 'O' else data[_is_finite(data)]
+    min_, max_ = _safe_bounds(data, lo, hi, sample)
+    if min_ is not None and units is not None:
+        min_ *= units
+    if max_ is not None and units is not None:
+        max_ *= units
+    return min_, max_
+
+
+def _is_float_array(data):
+    """
+    Test whether input is an unmasked numpy array of real numbers.
+    """
+    return (
+        type(data) in (np.ndarray, np.memmap)
+        and np.issubdtype(data.dtype, np.number)
+        and not np.issubdtype(data.dtype, np.complexfloating)
+    )
+
+
+def _is_finite(data):
+    """
+    Return whether values are finite. Non-numeric values are always finite.
+    """
+    try:
+        return np.isfinite(data)
+    except TypeError:
+        return np.ones(np.shape(data), dtype=bool)
+
+
+def _iter_chunks(data, size=None):
+    """
+    Iterate over the valid values in the flattened array in chunks. This bounds
+    the memory used to remove invalid values from large or memory-mapped arrays.
+    """
+    # NOTE: Value order does not matter here, so fortran-ordered arrays (e.g.
+    # transposed fields) are flattened in memory order. Other non-contiguous
+    # arrays (e.g. sliced fields) are split along the leading axis so that at
+    # most one chunk is copied at a time rather than the entire array.
+    size = size or 2 ** 22
+    if data.flags.f_contiguous:
+        data = data.T
+    if data.ndim <= 1 or data.flags.c_contiguous:
+        data = data.reshape(-1)  # always a view
+    step = max(1, size // max(1, int(np.prod(data.shape[1:]))))
+    for i in range(0, data.shape[0], step):
+        chunk = data[i:i + step].reshape(-1)  # copy if chunk is non-contiguous
+        if np.issubdtype(chunk.dtype, np.inexact):
+            chunk = chunk[np.isfinite(chunk)]
+        yield chunk
+
+
+def _compress_chunks(data):
+    """
+    Return a copy of the valid values in the flattened array. The values are
+    written chunk by chunk into one buffer so that only one copy is allocated.
+    """
+    buffer = np.empty(data.size, dtype=data.dtype)
+    size = 0
+    for chunk in _iter_chunks(data):
+        buffer[size:size + chunk.size] = chunk
+        size += chunk.size
+    return buffer[:size]
+
+
+def _safe_bounds(data, lo=0, hi=100, sample=None):
+    """
+    Return the minimum and maximum or percentiles of the valid array values.
+    """
+    # Get the minimum and maximum
     min_ = max_ = None
-    if data.size:
-        min_ = np.min(data) if lo <= 0 else np.percentile(data, lo)
-        if hasattr(min_, 'dtype') and np.issubdtype(min_.dtype, np.integer):
-            min_ = np.float64(min_)
-        try:
-            is_finite = np.isfinite(min_)
-        except TypeError:
-            is_finite = True
-        if not is_finite:
-            min_ = None
-        elif units is not None:
-            min_ *= units
-    if data.size:
-        max_ = np.max(data) if hi >= 100 else np.percentile(data, hi)
-        if hasattr(max_, 'dtype') and np.issubdtype(max_.dtype, np.integer):
-            max_ = np.float64(max_)
-        try:
-            is_finite = np.isfinite(min_)
-        except TypeError:
-            is_finite = True
-        if not is_finite:
-            max_ = None
-        elif units is not None:
-            max_ *= units
+    if np.issubdtype(data.dtype, np.number):
+        mins, maxs = [], []
+        for chunk in _iter_chunks(data):
+            if chunk.size:
+                mins.append(np.min(chunk))
+                maxs.append(np.max(chunk))
+        if not mins:
+            return None, None
+        min_, max_ = min(mins), max(maxs)
+    elif not data.size:
+        return None, None
+    elif lo <= 0 or hi >= 100:
+        min_, max_ = np.min(data), np.max(data)
+
+    # Get the percentiles
+    # NOTE: Samples are drawn with a fixed seed so that repeated plots of the same
+    # data are identical. Indices are sorted to read memory-mapped data in order.
+    qs = [q for q in (lo, hi) if 0 < q < 100]
+    if qs:
+        if sample and data.size > sample:
+            idx = np.random.default_rng(0).integers(0, data.size, sample)
+            data = data.flat[np.sort(idx)]
+        if np.issubdtype(data.dtype, np.number):
+            data = _compress_chunks(data)
+        ps = np.percentile(data, qs, overwrite_input=True) if data.size else ()
+        ps = dict(zip(qs, ps))
+        min_ = ps.get(lo, min_)
+        max_ = ps.get(hi, max_)
+
+    # Standardize the results
+    # NOTE: Integer extrema are converted to float for consistency with percentiles
+    bounds = []
+    for value in (min_, max_):
+        if hasattr(value, 'dtype') and np.issubdtype(value.dtype, np.integer):
+            value = np.float64(value)
+        if value is not None and not np.all(_is_finite(value)):
+            value = None
+        bounds.append(value)
+    return tuple(bounds)
+
+
+def _safe_bounds_lazy(data, lo=0, hi=100, sample=None):
+    """
+    Return the minimum and maximum or percentiles of the valid dask array values.
+    Blocks are reduced separately so the array is never loaded into memory at once.
+    """
+    # NOTE: Percentiles are estimated from random samples drawn from each block
+    # in proportion to the block size. Extrema are always exact.
+    import dask
+    if np.isnan(data.size):  # e.g. after boolean indexing
+        data = data.compute_chunk_sizes()
+    qs = [q for q in (lo, hi) if 0 < q < 100]
+    sample = _not_none(sample, LAZY_SAMPLE) if qs else 0
+    blocks = data.to_delayed().flat
+    reduce = dask.delayed(_safe_bounds_block, pure=True)
+    results = dask.compute(*(
+        reduce(block, i, int(np.ceil(sample * size / max(data.size, 1))))
+        for i, (block, size) in enumerate(zip(blocks, _iter_block_sizes(data)))
+    ))
+    mins = [min_ for min_, _, _ in results if min_ is not None]
+    maxs = [max_ for _, max_, _ in results if max_ is not None]
+    min_, max_ = min(mins, default=None), max(maxs, default=None)
+    if qs and min_ is not None:
+        values = np.concatenate([values for _, _, values in results])
+        pmin, pmax = _safe_bounds(values, lo, hi)
+        min_ = pmin if 0 < lo else min_
+        max_ = pmax if hi < 100 else max_
     return min_, max_
 
 
+def _safe_bounds_block(block, seed=0, sample=0):
+    """
+    Return the minimum, maximum, and a random sample of the valid block values.
+    """
+    block = np.asanyarray(block)
+    if isinstance(block, ma.MaskedArray):
+        block = block.filled(np.nan) if block.dtype.kind == 'f' else block.compressed()
+    min_, max_ = _safe_bounds(block)
+    if sample and block.size > sample:
+        idx = np.random.default_rng(seed).integers(0, block.size, sample)
+        block = block.flat[np.sort(idx)]
+    if sample:
+        values = block[_is_finite(block)].reshape(-1)
+    else:
+        values = np.array([], dtype=block.dtype)  # avoid views that retain the block
+    return min_, max_, values
+
+
+def _iter_block_sizes(data):
+    """
+    Iterate over the sizes of dask array blocks in the same order as
+    `dask.array.Array.to_delayed`.
+    """
+    for shape in itertools.product(*data.chunks):
+        yield np.prod(shape, dtype=int)
+
+
 # Metadata utilities
 def _meta_coords(*args, which='x', **kwargs):
     """
@@ -565,7 +838,7 @@ def _meta_labels(data, axis=0, always=True):
     labels = None
     if axis not in (0, 1, 2):
         raise ValueError(f'Invalid axis {axis}.')
-    if isinstance(data, (ndarray, Quantity)):
+    if isinstance(data, (ndarray, Quantity, DaskArray)):
         if not always:
             pass
         elif axis < data.ndim:
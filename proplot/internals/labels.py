@@ -2,12 +2,158 @@
 """
 Utilities related to matplotlib text labels.
 """
+import matplotlib.legend as mlegend
 import matplotlib.patheffects as mpatheffects
 import matplotlib.text as mtext
+import matplotlib.transforms as mtransforms
+import numpy as np
 
 from . import ic  # noqa: F401
 
 
+def _get_label_key(text, position=True):
+    """
+    Return a fingerprint of the text object properties that determine its
+    bounding box. Used to detect changes between automatic layouts.
+    """
+    key = (
+        text.get_visible(), text.get_text(), text.get_rotation(),
+        text.get_ha(), text.get_va(), hash(text.get_fontproperties()),
+    )
+    if position:
+        key += (text.get_position(),)
+    return key
+
+
+def _get_artist_key(artist, ignore_stale=False):
+    """
+    Return a fingerprint of the artist properties that determine its bounding box.
+    Other than text and legend content, changes are detected using the ``stale``
+    flag, which is set when artists are modified and cleared when they are drawn.
+    """
+    if isinstance(artist, mtext.Text):
+        return _get_label_key(artist)
+    if artist.stale and not ignore_stale:
+        return object()  # always compares unequal
+    key = (id(artist), artist.get_visible())
+    if isinstance(artist, mlegend.Legend):  # child text changes are not propagated
+        key += tuple(map(_get_label_key, (artist.get_title(), *artist.get_texts())))
+    return key
+
+
+class _memoize_metrics(object):
+    """
+    Context object that memoizes the text extents computed by the renderer. Used
+    to avoid measuring identical strings repeatedly during the automatic layout.
+    """
+    # NOTE: Text._get_layout caches extents by text position in a small dictionary
+    # (50 entries for matplotlib < 3.6) so label-heavy figures remeasure every
+    # label. Here rotation and position are ignored as they are applied afterward.
+    def __init__(self, renderer):
+        self._renderer = renderer
+        self._active = False
+
+    def __enter__(self):
+        renderer = self._renderer
+        name = 'get_text_width_height_descent'
+        if renderer is None or name in vars(renderer):  # nested context
+            return
+        func = getattr(renderer, name)
+        cache = {}
+        def _get_metrics(s, prop, ismath):  # noqa: E306
+            key = (s, hash(prop), ismath, renderer.dpi)
+            if key not in cache:
+                cache[key] = func(s, prop, ismath)
+            return cache[key]
+        setattr(renderer, name, _get_metrics)
+        self._active = True
+
+    def __exit__(self, *args):  # noqa: U100
+        if self._active:
+            delattr(self._renderer, 'get_text_width_height_descent')
+            self._active = False
+
+
+class _TextCollection(mtext.Text):
+    """
+    Text object that draws strings at arrays of positions with optional arrays of
+    colors. Used to draw many labels without creating an artist for each label.
+    """
+    # NOTE: Private attributes are assigned directly while drawing rather than using
+    # the setters because the setters mark the object and its parents as stale.
+    # NOTE: Text layouts are cached by matplotlib using keys that include the text
+    # position and color, so here layouts are also cached by the other properties.
+    def __init__(self, x, y, texts, colors=None, **kwargs):
+        super().__init__(**kwargs)
+        self._xs = np.asarray(x)
+        self._ys = np.asarray(y)
+        self._texts = list(texts)
+        self._colors = None if colors is None else list(colors)
+        self._border_kw = None  # stroke properties for inverted borders
+        self._layout_key = None
+        self._layouts = {}
+
+    def _get_layout(self, renderer):
+        # Return the cached layout for the text
+        key = (
+            hash(self._fontproperties), self._rotation, self._rotation_mode,
+            self._horizontalalignment, self._verticalalignment, self._linespacing,
+            self.get_usetex(), self.figure.dpi, id(renderer),
+        )
+        if key != self._layout_key:
+            self._layout_key = key
+            self._layouts.clear()
+        text = self._text
+        if text not in self._layouts:
+            self._layouts[text] = super()._get_layout(renderer)
+        return self._layouts[text]
+
+    def _iter_labels(self):
+        """
+        Temporarily apply the position, text, and color of each label. For inverted
+        borders the label color is applied to the border instead of the text.
+        """
+        x, y, text, color = self._x, self._y, self._text, self._color
+        effects = self._path_effects
+        try:
+            for i, (self._x, self._y, self._text) in enumerate(
+                zip(self._xs, self._ys, self._texts)
+            ):
+                if self._colors is None:
+                    pass
+                elif self._border_kw is None:
+                    self._color = self._colors[i]
+                else:
+                    kw = {**self._border_kw, 'foreground': self._colors[i]}
+                    self._path_effects = [
+                        mpatheffects.Stroke(**kw), mpatheffects.Normal()
+                    ]
+                yield
+        finally:
+            self._x, self._y, self._text, self._color = x, y, text, color
+            self._path_effects = effects
+
+    def draw(self, renderer):
+        # Draw each label with the same text object
+        if not self.get_visible():
+            return
+        with _memoize_metrics(renderer):
+            for _ in self._iter_labels():
+                super().draw(renderer)
+        self.stale = False
+
+    def get_window_extent(self, renderer=None, dpi=None):
+        # Return the union of the label extents
+        if not self.get_visible():
+            return mtransforms.Bbox.null()
+        with _memoize_metrics(renderer or getattr(self, '_renderer', None)):
+            bboxes = [
+                super(_TextCollection, self).get_window_extent(renderer, dpi)
+                for _ in self._iter_labels()
+            ]
+        return mtransforms.Bbox.union(bboxes) if bboxes else mtransforms.Bbox.null()
+
+
 def _transfer_label(src, dest):
     """
     Transfer the input text object properties and content to the destination
@@ -50,8 +196,12 @@ def _update_label(text, props=None, **kwargs):
         text.set_path_effects(
             [mpatheffects.Stroke(**kw), mpatheffects.Normal()],
         )
+        if isinstance(text, _TextCollection):  # apply label colors to the borders
+            text._border_kw = kw if borderinvert else None
     elif border is False:
         text.set_path_effects(None)
+        if isinstance(text, _TextCollection):
+            text._border_kw = None
 
     # Update bounding box
     # NOTE: We use '_title_pad' and '_title_above' for both titles and a-b-c
@@ -1076,6 +1076,13 @@ _rc_proplot_table = {
         'Whether to automatically apply a diverging colormap and '
         'normalizer based on the data.'
     ),
+    'cmap.cachesize': (
+        128,
+        _validate_int,
+        'Maximum number of results cached by `~proplot.constructor.Colormap` and '
+        '`~proplot.constructor.Cycle`. Set this to ``0`` to disable the cache. '
+        'Hit and miss counts are returned by e.g. ``Colormap.cache_info()``.'
+    ),
     'cmap.qualitative': (
         CMAPCAT,
         _validate_cmap('discrete'),
@@ -1130,6 +1137,13 @@ _rc_proplot_table = {
         'If ``True``, the default colormap `vmin` and `vmax` are chosen using the '
         '2nd to 98th percentiles rather than the minimum and maximum.'
     ),
+    'cmap.robust_sample': (
+        None,
+        _validate_or_none(_validate_int),
+        'If not ``None``, robust colormap limits for arrays larger than this are '
+        'estimated from a random sample with this many values. Useful for very '
+        'large arrays.'
+    ),
     'cmap.sequential': (
         CMAPSEQ,
         _validate_cmap('continuous'),
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Tools for profiling proplot performance.
+"""
+import json
+import os
+
+from .internals import ic  # noqa: F401
+from .internals import benchmarks
+
+__all__ = [
+    'enable',
+    'disable',
+    'reset',
+    'report',
+    'dump',
+    'add_callback',
+    'remove_callback',
+]
+
+
+def enable():
+    """
+    Start recording timings. Timings are recorded for figure layout, plotting
+    input parsing, colormap and color cycle construction, and ``format`` calls.
+    To record timings while proplot is imported, set the ``PROPLOT_PROFILE``
+    environment variable before importing proplot.
+
+    See also
+    --------
+    disable
+    report
+    """
+    benchmarks.BENCHMARK = True
+
+
+def disable():
+    """
+    Stop recording timings. Recorded timings are retained until `reset` is called.
+
+    See also
+    --------
+    enable
+    reset
+    """
+    benchmarks.BENCHMARK = False
+
+
+def reset():
+    """
+    Clear the recorded timings.
+
+    See also
+    --------
+    report
+    """
+    benchmarks._timer_stats.clear()
+
+
+def report(name=None):
+    """
+    Return the recorded timings.
+
+    Parameters
+    ----------
+    name : str, optional
+        The timer name. If passed, only this timer and the timers nested inside
+        it are returned. Nested timers use ``'/'``-delimited names, for example
+        ``'Figure.auto_layout/tight'`` or ``'import/config'``.
+
+    Returns
+    -------
+    dict
+        Dictionaries of the ``'count'``, ``'total'``, ``'mean'``, ``'min'``,
+        and ``'max'`` times in seconds indexed by timer name.
+
+    See also
+    --------
+    dump
+    reset
+    """
+    timings = {}
+    for path, (count, total, tmin, tmax) in benchmarks._timer_stats.items():
+        if name is not None and path != name and not path.startswith(name + '/'):
+            continue
+        timings[path] = {
+            'count': count, 'total': total, 'mean': total / count,
+            'min': tmin, 'max': tmax,
+        }
+    return timings
+
+
+def dump(path=None, name=None, **kwargs):
+    """
+    Return the recorded timings as a JSON string and optionally save them to a file.
+
+    Parameters
+    ----------
+    path : path-like, optional
+        The file path. User paths are expanded with `os.path.expanduser`.
+    name : str, optional
+        Passed to `report`.
+    **kwargs
+        Passed to `json.dumps`.
+
+    See also
+    --------
+    report
+    """
+    string = json.dumps(report(name), **kwargs)
+    if path is not None:
+        with open(os.path.expanduser(path), 'w') as fh:
+            fh.write(string)
+    return string
+
+
+def add_callback(func):
+    """
+    Add a function called with the timer name and time in seconds each
+    time a timer finishes.
+
+    Parameters
+    ----------
+    func : callable
+        The callback function.
+
+    See also
+    --------
+    remove_callback
+    """
+    if func not in benchmarks._timer_callbacks:
+        benchmarks._timer_callbacks.append(func)
+
+
+def remove_callback(func):
+    """
+    Remove a function added with `add_callback`.
+
+    Parameters
+    ----------
+    func : callable
+        The callback function.
+
+    See also
+    --------
+    add_callback
+    """
+    if func in benchmarks._timer_callbacks:
+        benchmarks._timer_callbacks.remove(func)
@@ -0,0 +1,295 @@
+import numpy as np
+import numpy.ma as ma
+import pytest
+
+import proplot as pplt
+from proplot.externals import hsluv
+
+
+# Reference values from the original scalar implementation. The hsl values
+# also match colorsys.rgb_to_hls() and colorsys.hls_to_rgb() after rescaling.
+RGB_COLORS = [(0, 0, 0), (1, 0, 0), (0.2, 0.4, 0.6), (0.9, 0.7, 0.1)]
+SPACE_COLORS = [(0, 100, 50), (120, 50, 50), (240, 80, 30), (300, 20, 90)]
+SPACE_REFERENCE = {
+    'hsl': (
+        [(0, 0, 0), (0, 100, 50), (210, 50, 40), (45, 80, 50)],
+        [(1, 0, 0), (0.25, 0.75, 0.25), (0.06, 0.06, 0.54), (0.92, 0.88, 0.92)],
+    ),
+    'hcl': (
+        [
+            (0, 0, 0), (12.1688, 179.0766, 53.2329),
+            (246.9442, 51.6956, 42.01), (60.5171, 87.6768, 75.3597),
+        ],
+        [
+            (0.825508, 0.248853, 0.415191), (0.316482, 0.515645, 0.232516),
+            (-1.35152, 0.32374, 0.604909), (0.942602, 0.862191, 0.96161),
+        ],
+    ),
+    'hsluv': (
+        [
+            (0, 0, 0), (12.1688, 99.9976, 53.2329),
+            (246.9442, 78.4486, 42.01), (60.5171, 97.6005, 75.3597),
+        ],
+        [
+            (0.917631, -1.3e-05, 0.393773), (0.366743, 0.502281, 0.320599),
+            (0.12656, 0.291267, 0.406121), (0.904529, 0.880085, 0.91054),
+        ],
+    ),
+    'hpluv': (
+        [
+            (0, 0, 0), (12.1688, 426.8089, 53.2329),
+            (246.9442, 156.126, 42.01), (60.5171, 147.6114, 75.3597),
+        ],
+        [
+            (0.639773, 0.398011, 0.447013), (0.410695, 0.488127, 0.387796),
+            (0.207347, 0.285154, 0.356803), (0.89985, 0.882185, 0.904198),
+        ],
+    ),
+}
+
+
+# Loop through all perceptual colorspaces.
+@pytest.mark.parametrize('space', ('hsl', 'hcl', 'hsluv', 'hpluv'))
+def test_colorspace_arrays(space):
+    """Tests that the conversions match the original scalar implementation."""
+    fwd, inv = SPACE_REFERENCE[space]
+    to_xyz = getattr(hsluv, f'rgb_to_{space}')
+    to_rgb = getattr(hsluv, f'{space}_to_rgb')
+    assert np.allclose([to_xyz(*color) for color in RGB_COLORS], fwd, atol=1e-4)
+    assert np.allclose([to_rgb(*color) for color in SPACE_COLORS], inv, atol=1e-6)
+    xyz = getattr(hsluv, f'rgb_to_{space}_array')(RGB_COLORS)
+    rgb = getattr(hsluv, f'{space}_to_rgb_array')(SPACE_COLORS)
+    assert xyz.shape == rgb.shape == (4, 3)
+    assert np.allclose(xyz, fwd, atol=1e-4)
+    assert np.allclose(rgb, inv, atol=1e-6)
+    rgb = np.random.default_rng(0).random((100, 3))
+    rgb_inv = getattr(hsluv, f'{space}_to_rgb_array')(
+        getattr(hsluv, f'rgb_to_{space}_array')(rgb)
+    )
+    assert np.allclose(rgb_inv, rgb, atol=1e-3)
+
+
+def test_colorspace_hsl():
+    """Tests that the hsl conversions match colorsys."""
+    import colorsys
+    for r, g, b in RGB_COLORS:
+        h, l, s = colorsys.rgb_to_hls(r, g, b)
+        assert np.allclose(hsluv.rgb_to_hsl(r, g, b), (360 * h, 100 * s, 100 * l))
+    for h, s, l in SPACE_COLORS:
+        rgb = colorsys.hls_to_rgb(h / 360, l / 100, s / 100)
+        assert np.allclose(hsluv.hsl_to_rgb(h, s, l), rgb)
+
+
+# Loop through normalizers with and without the linear fast path.
+@pytest.mark.parametrize('name', ('linear', 'diverging', 'log'))
+def test_discrete_norm_colors(name):
+    """Tests that fused discrete colors match the normalizer and colormap."""
+    levels = [0.1, 0.2, 0.5, 1, 2, 5]
+    data = 10 ** np.random.default_rng(0).uniform(-2, 1, (20, 30))
+    data = ma.masked_greater(data, 8)
+    cmap = pplt.Colormap('viridis')
+    cmap.set_under('red')
+    cmap.set_bad('blue')
+    for descending in (False, True):
+        norm = pplt.Norm(name)
+        norm = pplt.DiscreteNorm(levels[::-1] if descending else levels, norm=norm)
+        for bytes in (False, True):
+            rgba = norm._to_rgba(data, cmap, alpha=0.5, bytes=bytes)
+            assert np.array_equal(rgba, cmap(norm(data), alpha=0.5, bytes=bytes))
+
+
+def test_colormap_cache():
+    """Tests that cached colormaps are copies and are rebuilt on registration."""
+    pplt.Colormap.cache_clear()
+    cmap1 = pplt.Colormap('Reds', left=0.2)
+    cmap2 = pplt.Colormap('Reds', left=0.2)
+    assert pplt.Colormap.cache_info().hits == 1
+    assert cmap1 is not cmap2
+    assert np.array_equal(cmap1._lut, cmap2._lut)
+    cmap2.set_alpha(0.5)
+    cmap2._init()
+    assert np.all(pplt.Colormap('Reds', left=0.2)._lut[:-3, 3] == 1)
+    pplt.Colormap('Blues', name='_test_cache')  # private names are ignored
+    pplt.Colormap('Reds', left=0.2)
+    assert pplt.Colormap.cache_info()[:2] == (3, 2)
+    pplt.Colormap('Blues', name='test_cache')
+    pplt.Colormap('Reds', left=0.2)
+    assert pplt.Colormap.cache_info()[:2] == (3, 4)
+    pplt.Colormap('Blues', name='test_cache')  # identical names are ignored
+    pplt.Colormap('Reds', left=0.2)
+    assert pplt.Colormap.cache_info()[:2] == (5, 4)
+
+
+def test_colormap_cache_file(tmp_path):
+    """Tests that cached colormaps are rebuilt when their file changes."""
+    pplt.Colormap.cache_clear()
+    path = str(tmp_path / 'test_cache.rgb')
+    for i, color in enumerate(('1 0 0\n1 0 0\n', '0 0 1\n0 0 1\n0 0 1\n')):
+        with open(path, 'w') as f:
+            f.write(color)
+        cmap = pplt.Colormap(path)
+        assert pplt.to_hex(cmap(0.5), keep_alpha=False) == ('#ff0000', '#0000ff')[i]
+    assert pplt.Colormap.cache_info()[:2] == (0, 2)
+    pplt.Colormap(path)
+    assert pplt.Colormap.cache_info()[:2] == (1, 2)
+
+
+def test_colormap_cache_cycle():
+    """Tests that cached colormaps are rebuilt when the color cycle changes."""
+    pplt.Colormap.cache_clear()
+    with pplt.rc.context(cycle='538'):
+        cmap1 = pplt.Colormap('C1')
+    with pplt.rc.context(cycle='colorblind'):
+        cmap2 = pplt.Colormap('C1')
+    assert pplt.Colormap.cache_info()[:2] == (0, 2)
+    for cmap, cycle in ((cmap1, '538'), (cmap2, 'colorblind')):
+        color = pplt.Cycle(cycle).by_key()['color'][1]
+        assert pplt.to_hex(cmap(1.0)) == pplt.to_hex(color)
+
+
+# Loop through robust and default limits.
+@pytest.mark.parametrize('robust', (False, True))
+def test_robust_limits(robust):
+    """Tests that colormap limits ignore invalid values and match numpy."""
+    from proplot.internals import inputs
+    lo, hi = (2, 98) if robust else (0, 100)
+    data = np.random.default_rng(0).normal(size=(200, 300))
+    data[::3] = np.nan
+    data[0, 0] = np.inf
+    valid = data[np.isfinite(data)]
+    vmin, vmax = inputs._safe_range(ma.masked_greater(data, 10), lo, hi)
+    assert np.allclose((vmin, vmax), np.percentile(valid, (lo, hi)))
+    vmin, vmax = inputs._safe_range(data, lo, hi, sample=1000)
+    assert abs(vmin - np.percentile(valid, lo)) < 0.5
+    assert abs(vmax - np.percentile(valid, hi)) < 0.5
+    assert inputs._safe_range(np.full(10, np.nan), lo, hi) == (None, None)
+
+
+def test_robust_limits_strided():
+    """Tests that limits of non-contiguous arrays are found without a full copy."""
+    from proplot.internals import inputs
+    data = np.random.default_rng(0).normal(size=(200, 300))
+    data[::3] = np.nan
+    valid = data[np.isfinite(data)]
+    for arr in (data.T, data[:, ::2], data[::2].T):
+        vmin, vmax = inputs._safe_range(arr, 2, 98)
+        expected = arr[np.isfinite(arr)]
+        assert np.allclose((vmin, vmax), np.percentile(expected, (2, 98)))
+        assert inputs._safe_range(arr) == (np.min(expected), np.max(expected))
+    assert inputs._safe_range(data.T) == (valid.min(), valid.max())
+    ints = np.arange(60000).reshape(200, 300)
+    for arr in (ints.T, ints[:, ::2]):
+        chunks = list(inputs._iter_chunks(arr, size=1000))
+        assert max(chunk.size for chunk in chunks) <= 1000
+        assert np.array_equal(np.sort(np.concatenate(chunks)), np.sort(arr, None))
+        if arr.flags.f_contiguous:  # flattened in memory order without copying
+            assert all(np.shares_memory(chunk, ints) for chunk in chunks)
+
+
+def test_lazy_limits():
+    """Tests that dask arrays are reduced blockwise and decimated before plotting."""
+    da = pytest.importorskip('dask.array')
+    data = np.random.default_rng(0).normal(size=(400, 600))
+    data[::3] = np.nan
+    lazy = da.from_array(data, chunks=100)
+    from proplot.internals import inputs
+    assert type(inputs._to_numpy_array(lazy)) is np.ndarray  # e.g. for globe=True
+    assert inputs._to_numpy_array(lazy, lazy=True) is lazy
+    fig, axs = pplt.subplots(ncols=2)
+    m1 = axs[0].pcolormesh(data, discrete=False)
+    m2 = axs[1].pcolormesh(lazy, discrete=False)
+    assert (m1.norm.vmin, m1.norm.vmax) == (m2.norm.vmin, m2.norm.vmax)
+    with pplt.rc.context({'savefig.dpi': 50}):
+        m3 = axs[1].pcolormesh(lazy, discrete=False)
+    assert m3.get_array().size < data.size
+    assert axs[1].get_xlim() == axs[0].get_xlim()
+    pplt.close(fig)
+
+
+# Loop through block reduction methods.
+@pytest.mark.parametrize('method', ('mean', 'max', 'min', 'nearest'))
+def test_downsample(method):
+    """Tests that downsampled grids match the block reductions."""
+    data = np.random.default_rng(0).normal(size=(30, 40))
+    data[0, 0] = np.nan
+    fig, ax = pplt.subplots()
+    m = ax.pcolormesh(data, downsample=5, downsample_method=method, discrete=False)
+    blocks = data.reshape(6, 5, 8, 5).swapaxes(1, 2).reshape(6, 8, 25)
+    if method == 'nearest':
+        result = data[::5, ::5]
+    else:
+        result = getattr(np, 'nan' + method)(blocks, axis=-1)
+    assert np.allclose(m.get_array().reshape(6, 8), result, equal_nan=True)
+    assert (m.norm.vmin, m.norm.vmax) == (np.nanmin(data), np.nanmax(data))
+    pplt.close(fig)
+
+
+# Loop through label border settings.
+@pytest.mark.parametrize(
+    'labels_kw', ({}, {'border': True}, {'border': True, 'borderinvert': True})
+)
+def test_heatmap_labels(labels_kw):
+    """Tests that grid labels render the same as one text object per label."""
+    data = np.arange(12, dtype=float).reshape(3, 4)
+    data[1, 2] = np.nan
+    images = []
+    for collection in (True, False):
+        fig, ax = pplt.subplots(dpi=50)
+        m = ax.heatmap(
+            data, labels=collection, labels_kw=labels_kw, precision=0, cmap='greys'
+        )
+        if collection:
+            assert not m.get_edgecolors()[6].any()
+        else:
+            for (y, x), value in np.ndenumerate(data):
+                if np.isfinite(value):
+                    color = 'w' if value > 5 else 'k'
+                    ax.text(
+                        x, y, str(int(value)), color=color, ha='center',
+                        va='center', size=pplt.rc['font.smallsize'], **labels_kw
+                    )
+        fig.canvas.draw()
+        if collection:  # labels are added last
+            assert ax.texts[-1].get_window_extent().width > 0
+        images.append(np.asarray(fig.canvas.buffer_rgba()).copy())
+        pplt.close(fig)
+    assert np.array_equal(*images)
+
+
+# Loop through contour label placement modes.
+@pytest.mark.parametrize('labels_kw', ({}, {'fast': True}, {'maxlabels': 1}))
+def test_contour_labels(labels_kw):
+    """Tests that contour labels get per-level colors and respect the cap."""
+    x = np.linspace(0, 2 * np.pi, 40)
+    data = np.sin(x)[:, None] * np.cos(x)[None, :]
+    levels = np.linspace(-1, 1, 9)
+    fig, ax = pplt.subplots()
+    m = ax.contourf(data, levels=levels, labels=True, labels_kw=labels_kw)
+    texts = [obj for obj in ax.texts if obj.get_text()]
+    values = [float(obj.get_text().replace('\N{MINUS SIGN}', '-')) for obj in texts]
+    assert texts and set(values) <= set(levels)
+    for text, value in zip(texts, values):
+        lum = pplt.to_xyz(m.cmap(m.norm(value)))[2]
+        color = pplt.to_hex(text.get_color(), keep_alpha=False)
+        assert color == ('#ffffff' if lum < 50 else '#000000')
+    if 'maxlabels' in labels_kw:
+        assert max(values.count(value) for value in values) == 1
+    pplt.close(fig)
+
+
+def test_contour_labels_fallback(monkeypatch):
+    """Tests that fast contour labels match without recent matplotlib internals."""
+    import matplotlib.contour as mcontour
+    import matplotlib.ticker as mticker
+    x = np.linspace(0, 2 * np.pi, 40)
+    data = np.sin(x)[:, None] * np.cos(x)[None, :]
+    results = []
+    for fallback in (False, True):
+        if fallback:
+            monkeypatch.delattr(mcontour.ContourLabeler, '_get_nth_label_width')
+            monkeypatch.delattr(mticker.Formatter, 'format_ticks')
+        fig, ax = pplt.subplots()
+        ax.contour(data, levels=9, labels=True, labels_kw={'fast': True})
+        results.append([(t.get_text(), t.get_position()) for t in ax.texts])
+        pplt.close(fig)
+    assert results[0] and results[0] == results[1]
@@ -0,0 +1,89 @@
+import functools
+
+import numpy as np
+import pytest
+from matplotlib.image import imread
+
+import proplot as pplt
+
+
+def test_save_formats(tmp_path):
+    """Tests that saving multiple formats matches saving them one at a time."""
+    fig, axs = pplt.subplots(ncols=2, dpi=50)
+    for ax in axs:
+        ax.plot(np.arange(10), label='line')
+    axs[0].legend(loc='b')
+    axs.format(title='title', xlabel='xlabel', ylabel='ylabel')
+    fig.save(tmp_path / 'multi', formats=('png', 'pdf'), dpi=50)
+    fig.save(tmp_path / 'single.png', dpi=50)
+    assert (tmp_path / 'multi.pdf').exists()
+    fig.save(tmp_path / 'one', formats='png', dpi=50)
+    fig.save(tmp_path / 'two.png', formats=['pdf'], dpi=50)
+    assert (tmp_path / 'one.png').exists() and not (tmp_path / 'one').exists()
+    assert (tmp_path / 'two.pdf').exists() and not (tmp_path / 'two.png').exists()
+    assert np.all(imread(tmp_path / 'multi.png') == imread(tmp_path / 'single.png'))
+    with pytest.raises(ValueError):
+        fig.save([tmp_path / 'a.png', tmp_path / 'b.png'], formats=('png',))
+    pplt.close(fig)
+
+
+def _make_figure(title):
+    fig, axs = pplt.subplots()
+    axs.format(title=title, titleloc=pplt.rc['title.loc'])
+    return fig, axs
+
+
+def test_render_many(tmp_path):
+    """Tests that figures rendered by workers use the parent settings."""
+    specs = [
+        (functools.partial(_make_figure, str(i)), tmp_path / f'{i}.png')
+        for i in range(3)
+    ]
+    with pplt.rc.context({'title.loc': 'left'}):
+        results = list(pplt.render_many(specs, processes=2, dpi=50))
+        spec = (specs[0][0], tmp_path / 'serial.png')
+        serial = list(pplt.render_many([spec], processes=1, dpi=50))
+    assert sorted(result.index for result in results) == [0, 1, 2]
+    assert all(result.time > 0 for result in results + serial)
+    assert np.all(imread(tmp_path / '0.png') == imread(tmp_path / 'serial.png'))
+
+
+def test_profile():
+    """Tests that layout timings are recorded only when profiling is enabled."""
+    names = []
+    def _callback(name, seconds):  # noqa: E306, U100
+        names.append(name)
+    pplt.profile.add_callback(_callback)
+    pplt.profile.enable()
+    try:
+        fig, axs = pplt.subplots(ncols=2)
+        fig.auto_layout(force=True)
+    finally:
+        pplt.profile.disable()
+    report = pplt.profile.report('Figure.auto_layout')
+    assert 'Figure.auto_layout/tight' in report
+    assert all(name in names for name in report)
+    count = report['Figure.auto_layout']['count']
+    fig.auto_layout(force=True)
+    assert pplt.profile.report()['Figure.auto_layout']['count'] == count
+    pplt.profile.reset()
+    pplt.profile.remove_callback(_callback)
+    pplt.close(fig)
+
+
+def test_lazy_namespace():
+    """Tests that lazy mode keeps the star-import namespace unchanged."""
+    import os
+    import subprocess
+    import sys
+    code = 'from proplot import *; print(sorted(dir()))'
+    names = []
+    for lazy in ('', '1'):
+        env = {**os.environ, 'PROPLOT_LAZY': lazy}
+        result = subprocess.run(
+            [sys.executable, '-c', code], env=env, capture_output=True, text=True,
+            check=True,
+        )
+        names.append(result.stdout)
+    assert "'show_cmaps'" in names[1]
+    assert names[0] == names[1]
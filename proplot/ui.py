@@ -2,11 +2,16 @@
 """
 The starting point for creating proplot figures.
 """
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import matplotlib.pyplot as plt
 
 from . import axes as paxes
 from . import figure as pfigure
 from . import gridspec as pgridspec
+from .config import rc
 from .internals import ic  # noqa: F401
 from .internals import _not_none, _pop_params, _pop_props, _pop_rc, docstring
 
@@ -20,8 +25,12 @@ __all__ = [
     'ion',
     'ioff',
     'isinteractive',
+    'render_many',
 ]
 
+# Batch rendering result
+_RenderResult = namedtuple('RenderResult', ('index', 'path', 'time'))
+
 
 # Docstrings
 _pyplot_docstring = """
@@ -231,3 +240,85 @@ def subplots(*args, **kwargs):
     fig = figure(rc_kw=rc_kw, **kwargs)
     axs = fig.add_subplots(*args, rc_kw=rc_kw, **kwsubs)
     return fig, axs
+
+
+def _init_worker(state):
+    """
+    Prepare a worker process for rendering figures. Proplot is imported (and the
+    colormaps, cycles, colors, and fonts are registered) once per worker when
+    this function is unpickled, then the parent process settings are applied.
+    """
+    plt.switch_backend('agg')
+    rc._set_state(state)
+
+
+def _render_figure(func, path, kwargs):
+    """
+    Create the figure with the callable, save it, and return the elapsed time.
+    """
+    t = time.perf_counter()
+    result = func()
+    fig = result[0] if isinstance(result, tuple) else result
+    try:
+        fig.save(path, **kwargs)
+    finally:
+        plt.close(fig)
+    return time.perf_counter() - t
+
+
+def render_many(specs, processes=None, **kwargs):
+    """
+    Create and save many figures in parallel using a pool of worker processes.
+    Results are yielded as each figure is finished.
+
+    Parameters
+    ----------
+    specs : list of 2-tuple
+        The ``(func, path)`` pairs. Each `func` must be a picklable callable (e.g.,
+        a module-level function or `functools.partial`) that takes no arguments
+        and returns a `~proplot.figure.Figure` or a ``(fig, axs)`` tuple (e.g.,
+        the output of `~proplot.ui.subplots`). Each `path` is passed to
+        `~proplot.figure.Figure.save` and may be a list of paths.
+    processes : int, optional
+        The number of worker processes. By default, this is `os.cpu_count`.
+        If ``1``, the figures are rendered in the current process.
+    **kwargs
+        Passed to `~proplot.figure.Figure.save` (e.g., `formats` or `dpi`).
+
+    Yields
+    ------
+    index : int
+        The index of the figure in `specs`.
+    path : path-like or list
+        The output path(s) of the figure.
+    time : float
+        The time in seconds spent creating and saving the figure.
+
+    Notes
+    -----
+    Worker processes use the Agg backend and are initialized with a copy of the
+    current `~proplot.config.rc` settings. Colormaps, cycles, and fonts registered
+    at runtime are only available in the workers if the processes are forked.
+    Exceptions raised while rendering a figure are re-raised when its result
+    is retrieved.
+
+    See also
+    --------
+    proplot.figure.Figure.save
+    concurrent.futures.ProcessPoolExecutor
+    """
+    specs = list(specs)
+    if processes == 1:
+        for index, (func, path) in enumerate(specs):
+            yield _RenderResult(index, path, _render_figure(func, path, kwargs))
+        return
+    with ProcessPoolExecutor(
+        max_workers=processes, initializer=_init_worker, initargs=(rc._get_state(),)
+    ) as executor:
+        futures = {
+            executor.submit(_render_figure, func, path, kwargs): (index, path)
+            for index, (func, path) in enumerate(specs)
+        }
+        for future in as_completed(futures):
+            index, path = futures[future]
+            yield _RenderResult(index, path, future.result())
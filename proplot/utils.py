@@ -738,6 +738,51 @@ def to_xyza(color, space='hcl'):
     return (*color, opacity)
 
 
+def _to_rgb_array(colors, space='rgb', clip=True):
+    """
+    Translate an array of channel values from an arbitrary colorspace to RGB.
+    This is a vectorized version of `to_rgb` for ``(..., 3)`` arrays.
+    """
+    colors = np.asarray(colors, dtype=float)
+    if space == 'rgb':
+        scale = np.any(colors > 2, axis=-1, keepdims=True)
+        colors = np.where(scale, colors / 255, colors)  # scale to within 0-1
+    elif space == 'hsv':
+        colors = hsluv.hsl_to_rgb_array(colors)
+    elif space == 'hcl':
+        colors = hsluv.hcl_to_rgb_array(colors)
+    elif space == 'hsl':
+        colors = hsluv.hsluv_to_rgb_array(colors)
+    elif space == 'hpl':
+        colors = hsluv.hpluv_to_rgb_array(colors)
+    else:
+        raise ValueError(f'Invalid colorspace {space!r}.')
+    if clip:
+        colors = np.clip(colors, 0, 1)
+    return colors
+
+
+def _to_xyz_array(colors, space='hcl'):
+    """
+    Translate an array of RGB channel values to an arbitrary colorspace.
+    This is a vectorized version of `to_xyz` for ``(..., 3)`` arrays.
+    """
+    colors = _to_rgb_array(colors, 'rgb')  # scale and clip as with to_rgba
+    if space == 'rgb':
+        pass
+    elif space == 'hsv':
+        colors = hsluv.rgb_to_hsl_array(colors)
+    elif space == 'hcl':
+        colors = hsluv.rgb_to_hcl_array(colors)
+    elif space == 'hsl':
+        colors = hsluv.rgb_to_hsluv_array(colors)
+    elif space == 'hpl':
+        colors = hsluv.rgb_to_hpluv_array(colors)
+    else:
+        raise ValueError(f'Invalid colorspace {space}.')
+    return colors
+
+
 def _fontsize_to_pt(size):
     """
     Translate font preset size or unit string to points.